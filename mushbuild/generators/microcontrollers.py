@@ -10,10 +10,18 @@ from mushbuild.utils.topics import TopicResolver
 class MicrocontrollerConfigGenerator:
     """Generates autogen_config_<id>.refactor.h for microcontrollers (SSOT-derived topics)."""
 
-    def __init__(self, system_config: SystemDefinition, output_dir: Path, infrastructure_config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        system_config: SystemDefinition,
+        output_dir: Path,
+        infrastructure_config: Optional[Dict[str, Any]] = None,
+        topic_resolver: Optional[TopicResolver] = None,
+    ):
         self.system_config = system_config
         self.output_dir = output_dir
         self.infrastructure_config = infrastructure_config
+        # Shared by every header so each point's topic is generated at most once per run
+        self.topic_resolver = topic_resolver or TopicResolver(system_config)
 
     def generate(self, validated_components: Dict[str, Any], only: Optional[str] = None) -> bool:
         print("\n--- Microcontroller Config Header Generation (refactor) ---")
@@ -25,7 +33,7 @@ class MicrocontrollerConfigGenerator:
         else:
             only_set = None
 
-        micros = [c for c in self.system_config.components if c.type == ComponentType.MICROCONTROLLER]
+        micros = [c for c in self.system_config.components if c.type is ComponentType.MICROCONTROLLER]
         for comp in micros:
             micro_id = comp.id
             if only_set and micro_id not in only_set:
@@ -48,7 +56,7 @@ class MicrocontrollerConfigGenerator:
         return success
 
     def _generate_header_content(self, micro_id: str, config: MicrocontrollerConfig) -> str:
-        tr = TopicResolver(self.system_config)
+        tr = self.topic_resolver
         lines: list[str] = []
         lines.append("// autogen_config.h")
         lines.append(f"// Auto-generated configuration header for microcontroller: {micro_id}")
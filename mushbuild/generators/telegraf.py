@@ -23,6 +23,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional; this script otherwise only needs the stdlib
+    _json_loads = json.loads
+
 
 # Defaults (temporary until secrets/env refactor)
 DEFAULTS = {
@@ -47,7 +54,7 @@ def repo_root_from_this_file() -> Path:
 
 
 def load_registry(registry_path: Path) -> Dict[str, PointDef]:
-    data = json.loads(registry_path.read_text())
+    data = _json_loads(registry_path.read_bytes())
     points: Dict[str, PointDef] = {}
     for uuid, p in data["points"].items():
         points[uuid] = PointDef(
@@ -1,29 +1,28 @@
+import argparse
 from pathlib import Path
+from typing import List, Optional
 
 from mushbuild.validation.ssot import SSOTValidator
 from mushbuild.validation.components import ComponentConfigValidator
 from mushbuild.validation.cross import CrossValidator
-from mushbuild.utils.topics import TopicGenerator  # noqa: F401 (used by generators)
+from mushbuild.utils.topics import TopicGenerator, TopicResolver
 from mushbuild.generators.points_registry import PointsRegistryGenerator
 # Use the existing generator implementation to avoid unnecessary diffs
 from mushbuild.generators.microcontrollers import MicrocontrollerConfigGenerator
 
 from shared_libs.config_models.secrets import InfrastructureSecrets
-
-import yaml
+from mushbuild.utils.files import FileUtils
 
 
 def load_infrastructure_with_secrets(config_base_dir: Path) -> tuple[dict, InfrastructureSecrets]:
     infra_path = config_base_dir / "infrastructure_definition.yaml"
     infrastructure = {}
     if infra_path.exists():
-        with open(infra_path) as f:
-            infrastructure = yaml.safe_load(f) or {}
+        infrastructure = FileUtils.read_yaml(infra_path) or {}
 
     project_root = config_base_dir.parent
     secrets_path = project_root / "secrets" / "infrastructure_secrets.yaml"
-    with open(secrets_path) as f:
-        secrets_raw = yaml.safe_load(f) or {}
+    secrets_raw = FileUtils.read_yaml(secrets_path) or {}
 
     if isinstance(secrets_raw, dict) and (
         'WIFI_SSID' in secrets_raw or 'MQTT_BROKER_ADDRESS' in secrets_raw
@@ -53,29 +52,54 @@ def load_infrastructure_with_secrets(config_base_dir: Path) -> tuple[dict, Infra
     return infrastructure, secrets_model
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate SSOT/component configs and generate artifacts.")
+    parser.add_argument(
+        "--only",
+        metavar="COMP_ID[,COMP_ID...]",
+        default=None,
+        help="Comma-separated component IDs to validate/generate; other component YAMLs are not parsed.",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse validation results from _cache/ (pickles include resolved secrets; keep _cache/ untracked).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
     config_base_dir = Path(__file__).parent.parent / "config_sources"
     ssot_file = config_base_dir / "system_definition.yaml"
     points_out = Path(__file__).parent.parent / "artifacts" / "global_points_registry.refactor.json"
     micros_out_dir = config_base_dir / "microcontrollers" / "generated"
+    cache_dir = Path(__file__).parent.parent / "_cache" if args.cache else None
 
     infra, secrets_model = load_infrastructure_with_secrets(config_base_dir)
-    ssot = SSOTValidator(ssot_file).validate()
+    ssot_report, ssot = SSOTValidator(ssot_file, cache_dir).validate()
+    print(ssot_report.render())
     if ssot is None:
         raise SystemExit(1)
 
     points_by_uuid_map = {p.uuid: p for p in ssot.points}
-    components_ok, validated = ComponentConfigValidator(ssot, config_base_dir, infra, secrets_model).validate(points_by_uuid_map)
-    if not components_ok:
+    components_report, validated = ComponentConfigValidator(ssot, config_base_dir, infra, secrets_model, cache_dir=cache_dir).validate(points_by_uuid_map, only=args.only)
+    print(components_report.render())
+    if not components_report.ok:
         raise SystemExit(1)
 
-    if not CrossValidator(ssot).validate(validated):
+    cross_report = CrossValidator(ssot).validate(validated, points_by_uuid_map)
+    print(cross_report.render())
+    if not cross_report.ok:
         raise SystemExit(1)
 
-    PointsRegistryGenerator(ssot, points_out).generate()
+    # One generator shared by the registry and the headers so topics are computed once
+    topic_generator = TopicGenerator(ssot)
+    PointsRegistryGenerator(ssot, points_out, topic_generator).generate()
 
     # Generate headers for all micros
-    MicrocontrollerConfigGenerator(ssot, micros_out_dir).generate(validated)
+    topic_resolver = TopicResolver(ssot, topic_generator)
+    MicrocontrollerConfigGenerator(ssot, micros_out_dir, topic_resolver=topic_resolver).generate(validated, only=args.only)
 
 
 if __name__ == "__main__":
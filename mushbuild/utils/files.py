@@ -0,0 +1,50 @@
+import json
+import warnings
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json produces the same layout, just slower
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+    warnings.warn(
+        "PyYAML was built without libyaml; falling back to the pure-Python SafeLoader (slow YAML parsing).",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+__all__ = ["FileUtils", "SafeLoader"]
+
+
+class FileUtils:
+    """Utility class for reading YAML config files and serializing JSON output."""
+
+    @staticmethod
+    def parse_yaml(raw: bytes) -> Any:
+        """Parse YAML from bytes already read from disk (libyaml decodes them directly)."""
+        return yaml.load(raw, Loader=SafeLoader)
+
+    @staticmethod
+    def read_yaml(path: Path) -> Any:
+        return FileUtils.parse_yaml(path.read_bytes())
+
+    @staticmethod
+    def dump_json(data: Any) -> bytes:
+        """Serialize like json.dumps(data, indent=2) (non-ASCII escaped), via orjson when it is installed."""
+        if orjson is not None:
+            try:
+                dumped = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:  # e.g. types orjson refuses; let the stdlib encoder decide
+                dumped = None
+            # orjson cannot escape non-ASCII, so those payloads go through the stdlib encoder
+            if dumped is not None and dumped.isascii():
+                return dumped
+        return json.dumps(data, indent=2).encode("ascii")
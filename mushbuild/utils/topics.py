@@ -1,4 +1,7 @@
-from typing import Dict, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 from shared_libs.config_models.core_ssot_models import (
     SystemDefinition,
@@ -7,9 +10,17 @@ from shared_libs.config_models.core_ssot_models import (
     FunctionGrouping,
     DriverComponentDefinition,
     GovernorComponentDefinition,
-    MicrocontrollerComponentDefinition,
-    ManualSourceComponentDefinition,
 )
+from mushbuild.utils.uuid_utils import UUIDUtils
+
+
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+@lru_cache(maxsize=512)
+def _slugify(text: str) -> str:
+    # Inputs are unit strings from a small vocabulary, so nearly every call is a cache hit
+    return _SLUG_RE.sub("_", text.lower()).strip("_")
 
 
 class TopicGenerator:
@@ -19,35 +30,52 @@ class TopicGenerator:
         self.system_config = system_config
         self.global_prefix = system_config.global_settings.mqtt_topic_prefix
         self.component_by_id = {comp.id: comp for comp in system_config.components}
-        self.point_provider_map = self._build_point_provider_map()
+        self._prefix_by_comp = {cid: f"{self.global_prefix}{cid}" for cid in self.component_by_id}
+        self.point_provider_map: Mapping[PointUUID, str] = MappingProxyType(self._build_point_provider_map())
+        self._topics_cache: Optional[Mapping[PointUUID, str]] = None
+        self._topic_builders: Dict[FunctionGrouping, Callable[[PointDefinition, str], str]] = {
+            FunctionGrouping.SENSOR: self._topic_sensor,
+            FunctionGrouping.ACTUATOR: self._topic_actuator,
+            FunctionGrouping.STATUS: self._topic_status,
+            FunctionGrouping.COMMAND: self._topic_command,
+        }
 
     def _build_point_provider_map(self) -> Dict[PointUUID, str]:
         provider_map: Dict[PointUUID, str] = {}
         for comp in self.system_config.components:
-            if isinstance(comp, MicrocontrollerComponentDefinition):
-                for point_uuid in comp.points_provided:
-                    provider_map[point_uuid] = comp.id
-            elif isinstance(comp, (DriverComponentDefinition, GovernorComponentDefinition, ManualSourceComponentDefinition)):
-                if comp.virtual_points_provided:
-                    for point_uuid in comp.virtual_points_provided:
-                        provider_map[point_uuid] = comp.id
+            for point_uuid in UUIDUtils.provided_point_uuids(comp):
+                provider_map[point_uuid] = comp.id
         return provider_map
 
+    def generate_all_topics(self) -> Mapping[PointUUID, str]:
+        """Topic for every SSOT point, computed on first call and shared read-only afterwards."""
+        if self._topics_cache is None:
+            self._topics_cache = MappingProxyType(
+                {p.uuid: self.generate_topic_for_point(p) for p in self.system_config.points}
+            )
+        return self._topics_cache
+
     def generate_topic_for_point(self, point: PointDefinition) -> str:
         source_component_id = self._get_source_component_id(point)
+        try:
+            build_topic = self._topic_builders[point.function_grouping]
+        except KeyError:
+            raise ValueError(f"Unknown function_grouping: {point.function_grouping}") from None
+        return build_topic(point, source_component_id)
 
-        if point.function_grouping == FunctionGrouping.SENSOR:
-            units_slug = self._slugify(point.units)
-            return f"{self.global_prefix}{source_component_id}/sensors/{point.topic_originator_slug}/{units_slug}"
-        elif point.function_grouping == FunctionGrouping.ACTUATOR:
-            return f"{self.global_prefix}{source_component_id}/actuators/{point.topic_device_slug}/readback"
-        elif point.function_grouping == FunctionGrouping.STATUS:
-            return f"{self.global_prefix}{source_component_id}/statuses/{point.topic_status_slug}"
-        elif point.function_grouping == FunctionGrouping.COMMAND:
-            target_component_id = self._get_command_target_component_id(point)
-            return f"{self.global_prefix}{source_component_id}/commands/{target_component_id}/{point.topic_directive_slug}/write"
-        else:
-            raise ValueError(f"Unknown function_grouping: {point.function_grouping}")
+    def _topic_sensor(self, point: PointDefinition, source_component_id: str) -> str:
+        units_slug = _slugify(point.units)
+        return f"{self._prefix_by_comp[source_component_id]}/sensors/{point.topic_originator_slug}/{units_slug}"
+
+    def _topic_actuator(self, point: PointDefinition, source_component_id: str) -> str:
+        return f"{self._prefix_by_comp[source_component_id]}/actuators/{point.topic_device_slug}/readback"
+
+    def _topic_status(self, point: PointDefinition, source_component_id: str) -> str:
+        return f"{self._prefix_by_comp[source_component_id]}/statuses/{point.topic_status_slug}"
+
+    def _topic_command(self, point: PointDefinition, source_component_id: str) -> str:
+        target_component_id = self._get_command_target_component_id(point, source_component_id)
+        return f"{self._prefix_by_comp[source_component_id]}/commands/{target_component_id}/{point.topic_directive_slug}/write"
 
     def _get_source_component_id(self, point: PointDefinition) -> str:
         component_id = self.point_provider_map.get(point.uuid)
@@ -55,8 +83,7 @@ class TopicGenerator:
             raise ValueError(f"No component found that provides point UUID: {point.uuid}")
         return component_id
 
-    def _get_command_target_component_id(self, point: PointDefinition) -> str:
-        source_component_id = self._get_source_component_id(point)
+    def _get_command_target_component_id(self, point: PointDefinition, source_component_id: str) -> str:
         source_component = self.component_by_id.get(source_component_id)
         if source_component is None:
             raise ValueError(f"Source component not found: {source_component_id}")
@@ -83,28 +110,26 @@ class TopicGenerator:
                 f"Command point {point.uuid} is sourced by component type that doesn't control other components"
             )
 
-    @staticmethod
-    def _slugify(text: str) -> str:
-        import re
-        slug = re.sub(r"[^a-zA-Z0-9]+", "_", text.lower()).strip("_")
-        return slug
-
 
 class TopicResolver:
     """Thin helper around TopicGenerator with UUID-based lookups and command pairing."""
 
-    def __init__(self, system_config: SystemDefinition):
+    def __init__(self, system_config: SystemDefinition, topic_generator: Optional[TopicGenerator] = None):
         self.system_config = system_config
         self.points_by_uuid_map: Dict[PointUUID, PointDefinition] = {
             p.uuid: p for p in system_config.points
         }
-        self.topic_generator = TopicGenerator(system_config)
+        self.topic_generator = topic_generator or TopicGenerator(system_config)
+        self._topic_by_uuid: Dict[PointUUID, str] = {}
 
     def get_topic(self, point_uuid: PointUUID) -> str:
-        point = self.points_by_uuid_map.get(point_uuid)
-        if point is None:
-            raise ValueError(f"Point UUID not found: {point_uuid}")
-        return self.topic_generator.generate_topic_for_point(point)
+        topic = self._topic_by_uuid.get(point_uuid)
+        if topic is None:
+            point = self.points_by_uuid_map.get(point_uuid)
+            if point is None:
+                raise ValueError(f"Point UUID not found: {point_uuid}")
+            topic = self._topic_by_uuid[point_uuid] = self.topic_generator.generate_topic_for_point(point)
+        return topic
 
     def get_command_write_topic(self, readback_uuid: PointUUID) -> Optional[str]:
         for p in self.system_config.points:
@@ -1,15 +1,127 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Set, Union, get_args, get_origin
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, get_args, get_origin
 
 from pydantic import BaseModel
 
-from shared_libs.config_models.core_ssot_models import PointUUID
-from shared_libs.config_models.component_configs import (
-    DriverConfig,
-    MicrocontrollerConfig,
-    GovernorConfig,
-)
+from shared_libs.config_models.core_ssot_models import ComponentType, PointUUID
+
+
+_Handler = Callable[[Any, Set[str]], None]
+
+
+def _add_uuid(value: Any, uuids_set: Set[str]) -> None:
+    if isinstance(value, str):
+        uuids_set.add(value)
+
+
+def _add_uuid_items(value: Any, uuids_set: Set[str]) -> None:
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, str):
+                uuids_set.add(item)
+
+
+def _add_uuid_values(value: Any, uuids_set: Set[str]) -> None:
+    if isinstance(value, dict):
+        for item in value.values():
+            if isinstance(item, str):
+                uuids_set.add(item)
+
+
+def _recurse(value: Any, uuids_set: Set[str]) -> None:
+    # Also the marker for fields that extract_uuids_from_instance pushes onto its stack
+    UUIDUtils.extract_uuids_from_instance(value, uuids_set)
+
+
+def _is_uuid(annotation: Any) -> bool:
+    """True for PointUUID and Optional[PointUUID]."""
+    if annotation is PointUUID:
+        return True
+    return get_origin(annotation) is Union and PointUUID in get_args(annotation)
+
+
+def _mentions(annotation: Any, classes: Set[type]) -> bool:
+    """True if the annotation is PointUUID or refers (through generics) to one of `classes`."""
+    if annotation is PointUUID or annotation in classes:
+        return True
+    return any(_mentions(arg, classes) for arg in get_args(annotation))
+
+
+def _referenced_models(annotation: Any) -> Set[type]:
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return {annotation}
+    found: Set[type] = set()
+    for arg in get_args(annotation):
+        found |= _referenced_models(arg)
+    return found
+
+
+# Model classes whose instances can (transitively) contain a PointUUID, and all classes inspected so far
+_CLASSES_WITH_UUID: Set[type] = set()
+_KNOWN_MODELS: Set[type] = set()
+
+
+def _register_models(*roots: type) -> None:
+    """Walk the annotation graph from `roots` and mark every model class that can reach a PointUUID."""
+    pending = [root for root in roots if root not in _KNOWN_MODELS]
+    while pending:
+        cls = pending.pop()
+        if cls in _KNOWN_MODELS:
+            continue
+        _KNOWN_MODELS.add(cls)
+        for field_definition in cls.model_fields.values():
+            pending.extend(_referenced_models(field_definition.annotation) - _KNOWN_MODELS)
+
+    # Fixed point, so classes that only reach a UUID through a (possibly cyclic) reference get marked too
+    changed = True
+    while changed:
+        changed = False
+        for cls in _KNOWN_MODELS - _CLASSES_WITH_UUID:
+            if any(_mentions(f.annotation, _CLASSES_WITH_UUID) for f in cls.model_fields.values()):
+                _CLASSES_WITH_UUID.add(cls)
+                changed = True
+
+
+def _classify(annotation: Any) -> Optional[_Handler]:
+    """Pick the handler for one field annotation; None means the field can never yield a UUID."""
+    if _is_uuid(annotation):
+        return _add_uuid
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1:  # Optional[X]
+            return _classify(non_none[0])
+    elif origin in (list, tuple) and args and all(_is_uuid(arg) for arg in args if arg is not Ellipsis):
+        return _add_uuid_items
+    elif origin is dict and len(args) == 2 and _is_uuid(args[1]):
+        return _add_uuid_values
+    return _recurse if _mentions(annotation, _CLASSES_WITH_UUID) else None
+
+
+def _build_extractors(cls: type) -> Tuple[Tuple[str, _Handler], ...]:
+    _register_models(cls)
+    extractors = []
+    for field_name, field_definition in cls.model_fields.items():
+        handler = _classify(field_definition.annotation)
+        if handler is not None:
+            extractors.append((field_name, handler))
+    return tuple(extractors)
+
+
+# Per-model-class extraction table: (field_name, handler) for every field that can reach a UUID
+_EXTRACTOR_CACHE: Dict[type, Tuple[Tuple[str, _Handler], ...]] = {}
+
+
+# Field holding the point UUIDs that each SSOT component type provides
+_PROVIDED_POINTS_FIELD: Dict[ComponentType, str] = {
+    ComponentType.MICROCONTROLLER: "points_provided",
+    ComponentType.DRIVER: "virtual_points_provided",
+    ComponentType.GOVERNOR: "virtual_points_provided",
+    ComponentType.MANUAL: "virtual_points_provided",
+}
 
 
 class UUIDUtils:
@@ -18,87 +130,47 @@ class UUIDUtils:
     @staticmethod
     def extract_uuids_from_instance(instance: Optional[Any], uuids_set: Set[str]):
         """
-        Recursively extracts UUIDs from a Pydantic model instance or iterable
-        by checking if field annotations are PointUUID or generics containing PointUUID.
+        Extracts UUIDs from a Pydantic model instance or iterable by checking if
+        field annotations are PointUUID or generics containing PointUUID.
+        Field annotations are classified once per model class and cached; nested
+        values are walked with an explicit stack rather than recursion.
         """
-        if instance is None:
-            return
-
-        if isinstance(instance, BaseModel):
-            for field_name, field_definition in instance.model_fields.items():
-                field_value = getattr(instance, field_name)
-                annotation = field_definition.annotation
-
-                origin = get_origin(annotation)
-                args = get_args(annotation)
-
-                if annotation is PointUUID:
-                    if isinstance(field_value, str):
-                        uuids_set.add(field_value)
-                elif origin is Union and PointUUID in args:
-                    if isinstance(field_value, str):
-                        uuids_set.add(field_value)
-                elif origin is list and args and args[0] is PointUUID:
-                    if isinstance(field_value, list):
-                        for item in field_value:
-                            if isinstance(item, str):
-                                uuids_set.add(item)
-                elif origin is Union:  # Handles Optional[List[PointUUID]]
-                    is_optional_list_of_uuid = False
-                    for union_arg in args:
-                        if get_origin(union_arg) is list and get_args(union_arg) and get_args(union_arg)[0] is PointUUID:
-                            is_optional_list_of_uuid = True
-                            break
-                    if is_optional_list_of_uuid and isinstance(field_value, list):
-                        for item in field_value:
-                            if isinstance(item, str):  # PointUUID is a str
-                                uuids_set.add(item)
-                elif origin is dict and args and len(args) == 2:  # Dict[_, PointUUID] or Dict[_, Optional[PointUUID]]
-                    value_type_in_dict = args[1]
-                    dict_val_origin = get_origin(value_type_in_dict)
-                    dict_val_args = get_args(value_type_in_dict)
-
-                    if value_type_in_dict is PointUUID:
-                        if isinstance(field_value, dict):
-                            for val_item in field_value.values():
-                                if isinstance(val_item, str):
-                                    uuids_set.add(val_item)
-                    elif dict_val_origin is Union and PointUUID in dict_val_args:  # Optional[PointUUID]
-                        if isinstance(field_value, dict):
-                            for val_item in field_value.values():
-                                if isinstance(val_item, str):
-                                    uuids_set.add(val_item)
-                elif isinstance(field_value, BaseModel):  # Recurse nested models
-                    UUIDUtils.extract_uuids_from_instance(field_value, uuids_set)
-                elif isinstance(field_value, list):
-                    for item in field_value:
-                        UUIDUtils.extract_uuids_from_instance(item, uuids_set)
-                elif isinstance(field_value, dict):
-                    for value_in_dict in field_value.values():
-                        UUIDUtils.extract_uuids_from_instance(value_in_dict, uuids_set)
-        elif isinstance(instance, list):
-            for item in instance:
-                UUIDUtils.extract_uuids_from_instance(item, uuids_set)
-        elif isinstance(instance, dict):
-            for value in instance.values():
-                UUIDUtils.extract_uuids_from_instance(value, uuids_set)
+        stack = [instance]
+        append = stack.append
+        pop = stack.pop
+        while stack:
+            current = pop()
+            if current is None:
+                continue
+            if isinstance(current, BaseModel):
+                cls = type(current)
+                extractors = _EXTRACTOR_CACHE.get(cls)
+                if extractors is None:
+                    extractors = _EXTRACTOR_CACHE[cls] = _build_extractors(cls)
+                for field_name, handler in extractors:
+                    value = getattr(current, field_name)
+                    if value is None:  # unset Optional fields are the common case
+                        continue
+                    if handler is _recurse:
+                        append(value)
+                    else:
+                        handler(value, uuids_set)
+            elif isinstance(current, (list, tuple)):
+                stack.extend(current)
+            elif isinstance(current, dict):
+                stack.extend(current.values())
 
     @staticmethod
-    def extract_driver_point_uuids(config: DriverConfig) -> Set[str]:
+    def extract_point_uuids(config: Any) -> Set[str]:
+        """All point UUIDs referenced by a validated component config (driver, governor or microcontroller)."""
         uuids: Set[str] = set()
         UUIDUtils.extract_uuids_from_instance(config, uuids)
         return uuids
 
     @staticmethod
-    def extract_microcontroller_point_uuids(config: MicrocontrollerConfig) -> Set[str]:
-        uuids: Set[str] = set()
-        UUIDUtils.extract_uuids_from_instance(config, uuids)
-        return uuids
-
-    @staticmethod
-    def extract_governor_point_uuids(config: GovernorConfig) -> Set[str]:
-        uuids: Set[str] = set()
-        UUIDUtils.extract_uuids_from_instance(config, uuids)
-        return uuids
-
-
+    def provided_point_uuids(component: Any) -> List[PointUUID]:
+        """Point UUIDs an SSOT component definition provides, dispatched on component.type."""
+        field_name = _PROVIDED_POINTS_FIELD.get(component.type)
+        if field_name is None:
+            return []
+        return getattr(component, field_name) or []
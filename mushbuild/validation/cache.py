@@ -0,0 +1,63 @@
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pydantic
+
+
+class ValidationCache:
+    """Pickle cache of validated config models keyed by file bytes, model version and validation context.
+
+    Entries may contain secrets resolved during validation, so the cache directory must stay untracked.
+    """
+
+    def __init__(self, cache_dir: Path, context_digest: bytes = b""):
+        self.cache_dir = cache_dir
+        self.context_digest = context_digest
+        self._model_digests: Dict[type, bytes] = {}
+
+    def _model_digest(self, model: type) -> bytes:
+        digest = self._model_digests.get(model)
+        if digest is None:
+            # Every module in the model's package, so edits to shared types (e.g. PointUUID) invalidate old pickles too
+            h = hashlib.blake2b(digest_size=16)
+            source_file = inspect.getsourcefile(model)
+            if source_file:
+                for path in sorted(Path(source_file).parent.glob("*.py")):
+                    h.update(path.name.encode())
+                    h.update(path.read_bytes())
+            digest = self._model_digests[model] = h.digest()
+        return digest
+
+    def key(self, raw: bytes, model: type, scope: str = "") -> str:
+        h = hashlib.blake2b(raw)
+        h.update(model.__qualname__.encode())
+        h.update(self._model_digest(model))
+        h.update(pydantic.VERSION.encode())
+        h.update(scope.encode())
+        h.update(self.context_digest)
+        return h.hexdigest()
+
+    def load(self, key: str) -> Optional[Any]:
+        try:
+            with open(self.cache_dir / f"{key}.pkl", "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: treat as a miss and let the caller revalidate
+            return None
+
+    def store(self, key: str, value: Any) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_dir / f"{key}.pkl")
+        except Exception as e:
+            print(f"⚠️ Warning: could not write validation cache entry {key}: {e}")
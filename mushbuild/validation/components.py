@@ -1,8 +1,10 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 import yaml
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from shared_libs.config_models.core_ssot_models import (
     SystemDefinition,
@@ -10,12 +12,38 @@ from shared_libs.config_models.core_ssot_models import (
     PointDefinition,
     PointUUID,
 )
-from shared_libs.config_models.component_configs import (
-    DriverConfig,
-    GovernorConfig,
-    MicrocontrollerConfig,
-)
 from shared_libs.config_models.secrets import InfrastructureSecrets
+from mushbuild.utils.files import FileUtils
+from mushbuild.validation.cache import ValidationCache
+from mushbuild.validation.report import ValidationReport
+
+
+# Filled by _load_models() on first use, so importing this module does not build the component schemas
+COMPONENT_MODEL_MAP: Dict[ComponentType, type] = {}
+_ADAPTERS: Dict[type, TypeAdapter] = {}
+
+
+def _load_models() -> Dict[ComponentType, type]:
+    if not COMPONENT_MODEL_MAP:
+        from shared_libs.config_models.component_configs import (
+            DriverConfig,
+            GovernorConfig,
+            MicrocontrollerConfig,
+        )
+
+        COMPONENT_MODEL_MAP.update({
+            ComponentType.DRIVER: DriverConfig,
+            ComponentType.GOVERNOR: GovernorConfig,
+            ComponentType.MICROCONTROLLER: MicrocontrollerConfig,
+        })
+    return COMPONENT_MODEL_MAP
+
+
+def _adapter_for(model: type) -> TypeAdapter:
+    adapter = _ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _ADAPTERS[model] = TypeAdapter(model)
+    return adapter
 
 
 class ComponentConfigValidator:
@@ -27,73 +55,122 @@ class ComponentConfigValidator:
         config_base_dir: Path,
         infrastructure_config: Optional[Dict[str, Any]] = None,
         secrets_model: Optional[InfrastructureSecrets] = None,
+        max_workers: int = 8,
+        cache_dir: Optional[Path] = None,
     ):
         self.system_config = system_config
         self.config_base_dir = config_base_dir
         self.infrastructure_config = infrastructure_config
         self.secrets_model = secrets_model
-        self.component_model_map = {
-            ComponentType.DRIVER: DriverConfig,
-            ComponentType.GOVERNOR: GovernorConfig,
-            ComponentType.MICROCONTROLLER: MicrocontrollerConfig,
-        }
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.cache: Optional[ValidationCache] = None
+        self.component_model_map = _load_models()
 
-    def validate(self, points_by_uuid_map: Dict[PointUUID, PointDefinition]) -> Tuple[bool, Dict[str, Any]]:
-        print("\n--- Validating Component Configuration Files ---")
-        all_components_valid = True
+    def validate(
+        self,
+        points_by_uuid_map: Dict[PointUUID, PointDefinition],
+        only: Optional[str] = None,
+    ) -> Tuple[ValidationReport, Dict[str, Any]]:
+        report = ValidationReport("Component Configuration Validation")
         validated_configs: Dict[str, Any] = {}
 
-        for component in self.system_config.components:
-            print(f"\nValidating component: id='{component.id}', type='{component.type.value}'")
-            if component.config_file is None:
-                print(f"   Note: Component '{component.id}' has no config file. Skipping file validation.")
-                continue
-
-            component_config_path = self.config_base_dir / component.config_file
-            if not component_config_path.is_file():
-                print(f"❌ Error: Config file not found at '{component_config_path}'")
-                all_components_valid = False
-                continue
-
-            config_model = self.component_model_map.get(component.type)
-            if not config_model:
-                print(f"⚠️ Warning: No model defined for type '{component.type.value}'. Skipping validation for '{component.config_file}'.")
-                continue
-
-            try:
-                with open(component_config_path, "r") as f:
-                    component_data = yaml.safe_load(f)
-                if component_data is None:
-                    print(f"❌ Error: Component YAML '{component_config_path}' is empty or invalid.")
-                    all_components_valid = False
-                    continue
-            except yaml.YAMLError as e:
-                print(f"❌ Error parsing YAML for '{component_config_path}':\n{e}")
-                all_components_valid = False
-                continue
-            except Exception as e:
-                print(f"❌ Unexpected error loading '{component_config_path}': {e}")
-                all_components_valid = False
-                continue
-
-            try:
-                validation_context = {
-                    "points_by_uuid_map": points_by_uuid_map,
-                    "component_id": component.id,
-                    "infrastructure_secrets": self.secrets_model,
-                }
-                validated_component_config = config_model.model_validate(component_data, context=validation_context)
-                print(f"✅ Validation Successful for '{component.config_file}' using {config_model.__name__}.")
-                validated_configs[component.id] = validated_component_config
-            except ValidationError as e:
-                print(f"❌ Pydantic Validation Failed for '{component.config_file}'!")
-                print("   Error details:")
-                print(e)
-                all_components_valid = False
-            except Exception as e:
-                print(f"❌ Unexpected error during validation for '{component.config_file}': {e}")
-                all_components_valid = False
-
-        return all_components_valid, validated_configs
+        components = self.system_config.components
+        if only:
+            # Filter before the loop so YAMLs of unselected components are never opened
+            only_set = {cid.strip() for cid in only.split(',') if cid.strip()}
+            unknown = only_set - {c.id for c in components}
+            if unknown:
+                report.warn("--only", f"References component IDs not in SSOT: {sorted(unknown)}")
+            components = [c for c in components if c.id in only_set]
+
+        if self.cache_dir is not None:
+            self.cache = ValidationCache(self.cache_dir, self._context_digest(points_by_uuid_map))
+
+        if components:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(components))) as executor:
+                results = list(executor.map(lambda c: self._validate_one(c, points_by_uuid_map), components))
+            # Merge in submission order so output stays deterministic
+            for component, (component_report, validated_component_config) in zip(components, results):
+                report.extend(component_report)
+                if validated_component_config is not None:
+                    validated_configs[component.id] = validated_component_config
+
+        return report, validated_configs
+
+    def _context_digest(self, points_by_uuid_map: Dict[PointUUID, PointDefinition]) -> bytes:
+        """Fingerprint of everything besides the YAML itself that feeds model validation."""
+        h = hashlib.blake2b(digest_size=16)
+        for point in points_by_uuid_map.values():
+            h.update(point.model_dump_json().encode())
+        if self.secrets_model is not None:
+            h.update(self.secrets_model.model_dump_json().encode())
+        return h.digest()
+
+    def _validate_one(
+        self,
+        component: Any,
+        points_by_uuid_map: Dict[PointUUID, PointDefinition],
+    ) -> Tuple[ValidationReport, Optional[Any]]:
+        """Load and validate a single component YAML; safe to run concurrently."""
+        report = ValidationReport(component.id)
+        component_type = component.type.value
+        report.note(f"\nValidating component: id='{component.id}', type='{component_type}'")
+        if component.config_file is None:
+            report.note(f"   Note: Component '{component.id}' has no config file. Skipping file validation.")
+            return report, None
+
+        component_config_path = self.config_base_dir / component.config_file
+        if not component_config_path.is_file():
+            report.error(component.id, f"Config file not found at '{component_config_path}'")
+            return report, None
+
+        config_model = self.component_model_map.get(component.type)
+        if not config_model:
+            report.warn(
+                component.id,
+                f"No model defined for type '{component_type}'. Skipping validation for '{component.config_file}'.",
+            )
+            return report, None
+
+        try:
+            raw = component_config_path.read_bytes()
+        except OSError as e:
+            report.error(component.id, f"Error reading '{component_config_path}': {e}")
+            return report, None
+
+        cache_key = self.cache.key(raw, config_model, component.id) if self.cache else None
+        if cache_key is not None:
+            validated_component_config = self.cache.load(cache_key)
+            if validated_component_config is not None:
+                report.note(f"✅ Validation Successful for '{component.config_file}' using {config_model.__name__} (cached).")
+                return report, validated_component_config
 
+        try:
+            component_data = FileUtils.parse_yaml(raw)
+            if component_data is None:
+                report.error(component.id, f"Component YAML '{component_config_path}' is empty or invalid.")
+                return report, None
+        except yaml.YAMLError as e:
+            report.error(component.id, f"Error parsing YAML for '{component_config_path}':\n{e}")
+            return report, None
+        except Exception as e:
+            report.error(component.id, f"Unexpected error loading '{component_config_path}': {e}")
+            return report, None
 
+        try:
+            validation_context = {
+                "points_by_uuid_map": points_by_uuid_map,
+                "component_id": component.id,
+                "infrastructure_secrets": self.secrets_model,
+            }
+            validated_component_config = _adapter_for(config_model).validate_python(component_data, context=validation_context)
+            report.note(f"✅ Validation Successful for '{component.config_file}' using {config_model.__name__}.")
+            if cache_key is not None:
+                self.cache.store(cache_key, validated_component_config)
+            return report, validated_component_config
+        except ValidationError as e:
+            report.error(component.id, f"Pydantic Validation Failed for '{component.config_file}'!\n{e}")
+        except Exception as e:
+            report.error(component.id, f"Unexpected error during validation for '{component.config_file}': {e}")
+        return report, None
@@ -1,19 +1,14 @@
-from typing import Any, Dict, List, Set
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from shared_libs.config_models.core_ssot_models import (
     SystemDefinition,
+    ComponentType,
     PointUUID,
-    DriverComponentDefinition,
-    GovernorComponentDefinition,
-    MicrocontrollerComponentDefinition,
-    ManualSourceComponentDefinition,
-)
-from shared_libs.config_models.component_configs import (
-    DriverConfig,
-    GovernorConfig,
-    MicrocontrollerConfig,
+    PointDefinition,
 )
 from mushbuild.utils.uuid_utils import UUIDUtils
+from mushbuild.validation.report import ValidationReport
 
 
 class CrossValidator:
@@ -22,9 +17,12 @@ class CrossValidator:
     def __init__(self, system_config: SystemDefinition):
         self.system_config = system_config
 
-    def validate(self, validated_components: Dict[str, Any]) -> bool:
-        print("\n--- Performing Cross-Validation ---")
-        all_checks_passed = True
+    def validate(
+        self,
+        validated_components: Dict[str, Any],
+        points_by_uuid_map: Optional[Dict[PointUUID, PointDefinition]] = None,
+    ) -> ValidationReport:
+        report = ValidationReport("Cross-Validation")
         errors: Dict[str, List[str]] = {
             "point_uuid_ref": [],
             "component_id_ref": [],
@@ -36,52 +34,59 @@ class CrossValidator:
             "multiply_provided_points": [],
         }
 
-        master_point_uuids = {p.uuid for p in self.system_config.points}
-        points_by_uuid_map = {p.uuid: p for p in self.system_config.points}
-        master_component_ids = {c.id for c in self.system_config.components}
+        if points_by_uuid_map is None:
+            points_by_uuid_map = {p.uuid: p for p in self.system_config.points}
+        master_point_uuids = points_by_uuid_map.keys()
+
+        # Single pass over components: id index, point providers, and controls_* references to check later
+        components_by_id: Dict[str, Any] = {}
+        providers_by_uuid: Dict[PointUUID, List[str]] = {}
+        controls_refs: List[Tuple[str, str, str, str]] = []  # (kind, component id, field, referenced id)
+        for comp in self.system_config.components:
+            components_by_id[comp.id] = comp
+            for p_uuid in UUIDUtils.provided_point_uuids(comp):
+                providers_by_uuid.setdefault(p_uuid, []).append(comp.id)
+            comp_type = comp.type
+            if comp_type is ComponentType.DRIVER:
+                controls_refs.append(("DriverComponent", comp.id, "controls_microcontroller", comp.controls_microcontroller))
+            elif comp_type is ComponentType.GOVERNOR:
+                controls_refs.extend(
+                    ("GovernorComponent", comp.id, "controls_drivers", driver_id) for driver_id in comp.controls_drivers
+                )
+        master_component_ids = components_by_id.keys()
         master_hierarchy_levels = set(self.system_config.command_hierarchy)
 
         # Point UUID references in component configs exist in SSOT
-        print("\nChecking Point UUID references in component configs against SSOT master list...")
+        report.note("\nChecking Point UUID references in component configs against SSOT master list...")
         for component_id, config_object in validated_components.items():
-            component_def = next((c for c in self.system_config.components if c.id == component_id), None)
-            if not component_def:
+            if component_id not in components_by_id:
                 continue
 
-            referenced_uuids_in_component: Set[PointUUID] = set()
-            if isinstance(config_object, DriverConfig):
-                referenced_uuids_in_component = UUIDUtils.extract_driver_point_uuids(config_object)
-            elif isinstance(config_object, MicrocontrollerConfig):
-                referenced_uuids_in_component = UUIDUtils.extract_microcontroller_point_uuids(config_object)
-            elif isinstance(config_object, GovernorConfig):
-                referenced_uuids_in_component = UUIDUtils.extract_governor_point_uuids(config_object)
-
-            for uuid_ref in referenced_uuids_in_component:
-                if uuid_ref not in master_point_uuids:
-                    errors["point_uuid_ref"].append(
-                        f"Component '{component_id}' references undefined Point UUID '{uuid_ref}'."
-                    )
-                    all_checks_passed = False
+            referenced_uuids_in_component = UUIDUtils.extract_point_uuids(config_object)
+            # Diff against the dict itself: set.difference only probes per element for a set/dict argument
+            missing_uuids = referenced_uuids_in_component.difference(points_by_uuid_map)
+            for uuid_ref in sorted(missing_uuids):
+                errors["point_uuid_ref"].append(
+                    f"Component '{component_id}' references undefined Point UUID '{uuid_ref}'."
+                )
         if not errors["point_uuid_ref"]:
-            print("   ✅ Point UUID references in component configs exist in SSOT.")
+            report.note("   ✅ Point UUID references in component configs exist in SSOT.")
 
         # Uniqueness checks
-        print("\nChecking uniqueness of names and IDs in SSOT...")
-        point_names = [p.name for p in self.system_config.points]
-        duplicate_point_names = {n for n in point_names if point_names.count(n) > 1}
+        report.note("\nChecking uniqueness of names and IDs in SSOT...")
+        point_name_counts = Counter(p.name for p in self.system_config.points)
+        duplicate_point_names = {n for n, count in point_name_counts.items() if count > 1}
         if duplicate_point_names:
             errors["uniqueness"].append(f"Duplicate PointDefinition names found in SSOT: {duplicate_point_names}")
-            all_checks_passed = False
-        component_ids = [c.id for c in self.system_config.components]
-        duplicate_component_ids = {cid for cid in component_ids if component_ids.count(cid) > 1}
+        component_id_counts = Counter(c.id for c in self.system_config.components)
+        duplicate_component_ids = {cid for cid, count in component_id_counts.items() if count > 1}
         if duplicate_component_ids:
             errors["uniqueness"].append(f"Duplicate Component IDs found in SSOT: {duplicate_component_ids}")
-            all_checks_passed = False
         if not errors["uniqueness"]:
-            print("   ✅ Point names and Component IDs in SSOT are unique.")
+            report.note("   ✅ Point names and Component IDs in SSOT are unique.")
 
         # 'writable_by' and controls_* references
-        print("\nChecking component/hierarchy references in SSOT ('writable_by', 'controls_')...")
+        report.note("\nChecking component/hierarchy references in SSOT ('writable_by', 'controls_')...")
         for point in self.system_config.points:
             if point.writable_by:
                 for writer_id in point.writable_by:
@@ -89,81 +94,50 @@ class CrossValidator:
                         errors["hierarchy_ref"].append(
                             f"Point '{point.uuid}' ({point.name}): 'writable_by' item '{writer_id}' is not a defined component ID or command hierarchy level."
                         )
-                        all_checks_passed = False
 
-        for comp in self.system_config.components:
-            if isinstance(comp, DriverComponentDefinition):
-                if comp.controls_microcontroller not in master_component_ids:
-                    errors["component_id_ref"].append(
-                        f"DriverComponent '{comp.id}' 'controls_microcontroller' references undefined component ID '{comp.controls_microcontroller}'."
-                    )
-                    all_checks_passed = False
-            elif isinstance(comp, GovernorComponentDefinition):
-                for driver_id in comp.controls_drivers:
-                    if driver_id not in master_component_ids:
-                        errors["component_id_ref"].append(
-                            f"GovernorComponent '{comp.id}' 'controls_drivers' references undefined component ID '{driver_id}'."
-                        )
-                        all_checks_passed = False
+        for kind, comp_id, field_name, ref_id in controls_refs:
+            if ref_id not in master_component_ids:
+                errors["component_id_ref"].append(
+                    f"{kind} '{comp_id}' '{field_name}' references undefined component ID '{ref_id}'."
+                )
         if not errors["hierarchy_ref"] and not errors["component_id_ref"]:
-            print("   ✅ 'writable_by' and 'controls_' references in SSOT appear valid.")
+            report.note("   ✅ 'writable_by' and 'controls_' references in SSOT appear valid.")
 
         # Point provisioning
-        print("\nChecking point provisioning by components in SSOT...")
-        master_point_uuids_set = set(master_point_uuids)
-        claimed_list: List[PointUUID] = []
-        for comp in self.system_config.components:
-            if isinstance(comp, MicrocontrollerComponentDefinition):
-                claimed_list.extend(comp.points_provided)
-            elif isinstance(comp, (DriverComponentDefinition, GovernorComponentDefinition, ManualSourceComponentDefinition)):
-                if comp.virtual_points_provided:
-                    claimed_list.extend(comp.virtual_points_provided)
-
-        claimed_set = set(claimed_list)
-        orphaned = master_point_uuids_set - claimed_set
-        if orphaned:
-            for p_uuid in orphaned:
-                name = points_by_uuid_map[p_uuid].name if p_uuid in points_by_uuid_map else "N/A"
-                errors["orphaned_points"].append(
-                    f"Point UUID '{p_uuid}' (Name: {name}) is not provided by any component."
-                )
-            all_checks_passed = False
-
-        from collections import Counter
-        multi = {uuid for uuid, count in Counter(claimed_list).items() if count > 1}
-        if multi:
-            for m_uuid in multi:
+        report.note("\nChecking point provisioning by components in SSOT...")
+        for p_uuid in sorted(providers_by_uuid.keys() - master_point_uuids):
+            errors["point_provision"].append(
+                f"Point UUID '{p_uuid}' provided by {providers_by_uuid[p_uuid]} is not defined in SSOT points."
+            )
+
+        orphaned = master_point_uuids - providers_by_uuid.keys()
+        for p_uuid in sorted(orphaned):
+            errors["orphaned_points"].append(
+                f"Point UUID '{p_uuid}' (Name: {points_by_uuid_map[p_uuid].name}) is not provided by any component."
+            )
+
+        for m_uuid, provider_ids in providers_by_uuid.items():
+            if len(provider_ids) > 1:
                 errors["multiply_provided_points"].append(
-                    f"Point UUID '{m_uuid}' is provided by multiple components."
+                    f"Point UUID '{m_uuid}' is provided by multiple components: {provider_ids}."
                 )
-            all_checks_passed = False
 
-        if not errors["orphaned_points"] and not errors["multiply_provided_points"]:
-            print("   ✅ All system-provided points are uniquely claimed by a component.")
+        if not errors["point_provision"] and not errors["orphaned_points"] and not errors["multiply_provided_points"]:
+            report.note("   ✅ All system-provided points are uniquely claimed by a component.")
 
         # Command/readback linkages
-        print("\nChecking command/readback point linkages in SSOT...")
-        for p_uuid, p_def in points_by_uuid_map.items():
-            if p_def.readback_point_uuid:
-                rb_uuid = p_def.readback_point_uuid
-                if rb_uuid == p_uuid or rb_uuid not in points_by_uuid_map:
-                    errors["command_readback_link"].append(
-                        f"Invalid readback link from '{p_uuid}' to '{rb_uuid}'."
-                    )
-                    all_checks_passed = False
+        report.note("\nChecking command/readback point linkages in SSOT...")
+        readback_links = ((p_uuid, p_def.readback_point_uuid) for p_uuid, p_def in points_by_uuid_map.items())
+        errors["command_readback_link"].extend(
+            f"Invalid readback link from '{p_uuid}' to '{rb_uuid}'."
+            for p_uuid, rb_uuid in readback_links
+            if rb_uuid and (rb_uuid == p_uuid or rb_uuid not in points_by_uuid_map)
+        )
         if not errors["command_readback_link"]:
-            print("   ✅ Command/readback point linkages appear consistent.")
-
-        if not all_checks_passed:
-            print("\n❌ Cross-Validation Failed!")
-            for category, msgs in errors.items():
-                if msgs:
-                    print(f"   --- {category} ---")
-                    for msg in msgs:
-                        print(f"      - {msg}")
-        else:
-            print("\n✅ All Cross-Validation Checks Passed.")
-
-        return all_checks_passed
+            report.note("   ✅ Command/readback point linkages appear consistent.")
 
+        for category, msgs in errors.items():
+            for msg in msgs:
+                report.error(category, msg)
 
+        return report
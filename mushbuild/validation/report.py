@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of one validation phase; collected silently and rendered once by the caller."""
+
+    title: str
+    ok: bool = True
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+    warnings: List[Tuple[str, str]] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+
+    def error(self, source: str, message: str) -> None:
+        self.errors.append((source, message))
+        self.ok = False
+
+    def warn(self, source: str, message: str) -> None:
+        self.warnings.append((source, message))
+
+    def note(self, message: str) -> None:
+        self.notes.append(message)
+
+    def extend(self, other: "ValidationReport") -> None:
+        """Append another report's entries (e.g. a per-item sub-report) to this one."""
+        self.ok = self.ok and other.ok
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.notes.extend(other.notes)
+
+    def render(self) -> str:
+        lines: List[str] = [f"\n--- {self.title} ---"]
+        lines.extend(self.notes)
+        for heading, entries in (("⚠️ Warnings", self.warnings), ("❌ Errors", self.errors)):
+            if not entries:
+                continue
+            lines.append(f"\n{heading}:")
+            grouped: Dict[str, List[str]] = {}
+            for source, message in entries:
+                grouped.setdefault(source, []).append(message)
+            for source, messages in grouped.items():
+                lines.append(f"   --- {source} ---")
+                for message in messages:
+                    lines.append("      - " + message.replace("\n", "\n        "))
+        lines.append(f"\n✅ {self.title} passed." if self.ok else f"\n❌ {self.title} failed!")
+        return "\n".join(lines)
@@ -1,97 +1,69 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from pydantic import ValidationError
 
-from shared_libs.config_models.core_ssot_models import SystemDefinition
+from shared_libs.config_models.core_ssot_models import SystemDefinition, validate_system_python
+from mushbuild.utils.files import FileUtils
+from mushbuild.validation.cache import ValidationCache
+from mushbuild.validation.report import ValidationReport
 
 
 class SSOTValidator:
     """Validates the SSOT YAML file and returns a SystemDefinition model."""
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, cache_dir: Optional[Path] = None):
         self.file_path = file_path
+        self.cache = ValidationCache(cache_dir) if cache_dir is not None else None
 
-    def validate(self) -> Optional[SystemDefinition]:
-        print(f"\n--- Validating SSOT File: {self.file_path} ---")
+    def validate(self) -> Tuple[ValidationReport, Optional[SystemDefinition]]:
+        report = ValidationReport("SSOT Validation")
+        report.note(f"SSOT file: {self.file_path}")
+        source = self.file_path.name
         if not self.file_path.is_file():
-            print(f"❌ Error: SSOT file not found at '{self.file_path}'")
-            return None
+            report.error(source, f"SSOT file not found at '{self.file_path}'")
+            return report, None
 
         try:
-            import yaml
-            with open(self.file_path, "r") as f:
-                loaded_data = yaml.safe_load(f)
-        except Exception as e:
-            print(f"❌ Error loading SSOT YAML: {e}")
-            return None
-
-        if loaded_data is None:
-            print("❌ Error: SSOT YAML is empty or invalid.")
-            return None
-
-        try:
-            system_config = SystemDefinition(**loaded_data)
-            print("✅ SSOT Structure Validation Successful!")
-            print(f"   Components Found: {len(system_config.components)}")
-            print(f"   Points Found: {len(system_config.points)}")
-            return system_config
-        except ValidationError as e:
-            print("❌ Pydantic Validation Failed for SSOT file!")
-            print("   Please check system_definition.yaml against the SystemDefinition model.")
-            print("   Error details:")
-            print(e)
-            return None
-        except Exception as e:
-            print(f"❌ An unexpected error occurred during SSOT validation: {e}")
-            return None
-
-from pathlib import Path
-from typing import Optional
-
-from pydantic import ValidationError
-
-from shared_libs.config_models.core_ssot_models import SystemDefinition
-
-
-class SSOTValidator:
-    """Validates the SSOT YAML file and returns a SystemDefinition model."""
-
-    def __init__(self, file_path: Path):
-        self.file_path = file_path
-
-    def validate(self) -> Optional[SystemDefinition]:
-        print(f"\n--- Validating SSOT File: {self.file_path} ---")
-        if not self.file_path.is_file():
-            print(f"❌ Error: SSOT file not found at '{self.file_path}'")
-            return None
+            raw = self.file_path.read_bytes()
+        except OSError as e:
+            report.error(source, f"Error reading SSOT file: {e}")
+            return report, None
+
+        cache_key = self.cache.key(raw, SystemDefinition) if self.cache else None
+        if cache_key is not None:
+            system_config = self.cache.load(cache_key)
+            if system_config is not None:
+                report.note("✅ SSOT Structure Validation Successful! (cached)")
+                report.note(f"   Components Found: {len(system_config.components)}")
+                report.note(f"   Points Found: {len(system_config.points)}")
+                return report, system_config
 
         try:
-            import yaml
-            with open(self.file_path, "r") as f:
-                loaded_data = yaml.safe_load(f)
+            loaded_data = FileUtils.parse_yaml(raw)
         except Exception as e:
-            print(f"❌ Error loading SSOT YAML: {e}")
-            return None
+            report.error(source, f"Error loading SSOT YAML: {e}")
+            return report, None
 
         if loaded_data is None:
-            print("❌ Error: SSOT YAML is empty or invalid.")
-            return None
+            report.error(source, "SSOT YAML is empty or invalid.")
+            return report, None
 
         try:
-            system_config = SystemDefinition(**loaded_data)
-            print("✅ SSOT Structure Validation Successful!")
-            print(f"   Components Found: {len(system_config.components)}")
-            print(f"   Points Found: {len(system_config.points)}")
-            return system_config
+            system_config = validate_system_python(loaded_data)
+            report.note("✅ SSOT Structure Validation Successful!")
+            report.note(f"   Components Found: {len(system_config.components)}")
+            report.note(f"   Points Found: {len(system_config.points)}")
+            if cache_key is not None:
+                self.cache.store(cache_key, system_config)
+            return report, system_config
         except ValidationError as e:
-            print("❌ Pydantic Validation Failed for SSOT file!")
-            print("   Please check system_definition.yaml against the SystemDefinition model.")
-            print("   Error details:")
-            print(e)
-            return None
+            report.error(
+                source,
+                "Pydantic Validation Failed for SSOT file! Please check system_definition.yaml "
+                f"against the SystemDefinition model.\n{e}",
+            )
+            return report, None
         except Exception as e:
-            print(f"❌ An unexpected error occurred during SSOT validation: {e}")
-            return None
-
-
+            report.error(source, f"An unexpected error occurred during SSOT validation: {e}")
+            return report, None
@@ -1,8 +1,11 @@
 # common/config_models/component_configs.py
 
 import enum
-from typing import Any, Dict, List, Optional, Union, Literal, Self, Type
-from pydantic import BaseModel, Field, model_validator, ValidationInfo
+import operator
+from functools import cached_property
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, Dict, List, Mapping, Optional, Tuple, Union, Literal, Self, Type
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field, StrictBool, StrictFloat, StrictInt, StrictStr, model_validator, ValidationInfo
 from pydantic_core import core_schema
 # Correct import path for GetCoreSchemaHandler in Pydantic V2
 from pydantic.annotated_handlers import GetCoreSchemaHandler
@@ -21,98 +24,124 @@ class ComparatorType(str, enum.Enum):
     GE = ">="
     LE = "<="
 
+    @property
+    def operator(self) -> Callable[[Any, Any], bool]:
+        """The comparison function for this comparator, e.g. operator.ge for '>='."""
+        return _COMPARATOR_OPS[self]
+
+# Resolved once so evaluators call comparator.operator(a, b) instead of branching on the symbol
+_COMPARATOR_OPS: Mapping[ComparatorType, Callable[[Any, Any], bool]] = MappingProxyType({
+    ComparatorType.EQ: operator.eq,
+    ComparatorType.NE: operator.ne,
+    ComparatorType.GT: operator.gt,
+    ComparatorType.LT: operator.lt,
+    ComparatorType.GE: operator.ge,
+    ComparatorType.LE: operator.le,
+})
+
+# Scalar a point can hold; strict members keep "1" a string and 1 an int instead of coercing
+PointValue = Union[StrictBool, StrictInt, StrictFloat, StrictStr]
+
 # --- Action Definitions ---
 class WriteAction(BaseModel):
     action_type: Literal["write_to_point"] = Field("write_to_point", description="Type indicator for this action.")
     point_uuid: PointUUID = Field(..., description="UUID of the Point to write to.")
-    value: Any = Field(..., description="The value to write to the point.")
-    model_config = {"extra": "forbid"}
+    value: PointValue = Field(..., description="The value to write to the point.")
+    model_config = {"extra": "forbid", "frozen": True}
 
 AnyAction = WriteAction
 
 # --- State Definition ---
 class StateCondition(BaseModel):
     point_uuid: PointUUID = Field(..., description="UUID of the point whose value is checked.")
-    expected_value: Any = Field(..., description="The value the point must have.")
-    model_config = {"extra": "forbid"}
+    expected_value: PointValue = Field(..., description="The value the point must have.")
+    model_config = {"extra": "forbid", "frozen": True}
 
 class StateDefinition(BaseModel):
-    defining_conditions: List[StateCondition] = Field(...,
+    defining_conditions: Tuple[StateCondition, ...] = Field(...,
         description="List of conditions that MUST ALL be true simultaneously for the system to BE considered in this state.")
-    entry_actions: List[AnyAction] = Field([],
+    entry_actions: Tuple[AnyAction, ...] = Field((),
         description="List of actions to perform immediately upon entering this state.")
-    exit_actions: List[AnyAction] = Field([],
+    exit_actions: Tuple[AnyAction, ...] = Field((),
         description="List of actions to perform immediately upon exiting this state.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # --- Constraint Definitions ---
 class BaseConstraintDefinition(BaseModel):
     description: Optional[str] = Field(None, description="Optional description of the constraint's purpose.")
     id: Optional[int] = Field(None, description="Optional numeric identifier for this constraint definition.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
+
+class StaticComparand(BaseModel):
+    source: Literal["static"] = Field(..., description="Type indicator for a static comparand.")
+    value: PointValue = Field(..., description="Static value (B) to compare against.")
+    model_config = {"extra": "forbid", "frozen": True}
+
+class StaticDurationComparand(StaticComparand):
+    value: float = Field(..., description="Static duration value (B, in seconds).")
+
+class PointComparand(BaseModel):
+    source: Literal["point"] = Field(..., description="Type indicator for a point comparand.")
+    point_uuid: PointUUID = Field(..., description="UUID of the Point (B) providing the dynamic value to compare against.")
+    model_config = {"extra": "forbid", "frozen": True}
+
+# Exactly one comparand source, enforced by the tag rather than an after-validator
+AnyComparand = Annotated[Union[StaticComparand, PointComparand], Field(discriminator="source")]
+AnyDurationComparand = Annotated[Union[StaticDurationComparand, PointComparand], Field(discriminator="source")]
 
 class ValueConstraintDefinition(BaseConstraintDefinition):
     type: Literal["value", "discrete_value", "continuous_value"] = Field(..., description="Type indicator for value comparison.")
     value_A_point_uuid: PointUUID = Field(..., description="UUID of the primary Point (A) whose value is being checked.")
     comparator: ComparatorType = Field(..., description="The comparison operator.")
-    comparand_B_static_value: Optional[Any] = Field(None, description="Static value (B) to compare against. Use EITHER this OR comparand_B_point_uuid.")
-    comparand_B_point_uuid: Optional[PointUUID] = Field(None, description="UUID of the Point (B) providing the dynamic value to compare against. Use EITHER this OR comparand_B_static_value.")
-
-    @model_validator(mode='after')
-    def check_comparand_b_source(self) -> Self:
-        static_present = self.comparand_B_static_value is not None
-        point_present = self.comparand_B_point_uuid is not None
-        if static_present == point_present:
-            raise ValueError('Exactly one of "comparand_B_static_value" or "comparand_B_point_uuid" must be provided for ValueConstraintDefinition')
-        return self
+    comparand_B: AnyComparand = Field(..., description="Value (B) to compare against: a static value or the value of another Point.")
 
 class StateTimeConstraintDefinition(BaseConstraintDefinition):
     type: Literal["state_time"] = Field(..., description="Type indicator for state time comparison.")
     value_A_point_uuid: PointUUID = Field(..., description="UUID of the Point representing time elapsed in the current state (A).")
     comparator: ComparatorType = Field(ComparatorType.GE, description="Comparison operator (usually >= for time).")
-    comparand_B_static_value: Optional[float] = Field(None, description="Static duration value (B, in seconds). Use EITHER this OR comparand_B_point_uuid.")
-    comparand_B_point_uuid: Optional[PointUUID] = Field(None, description="UUID of the Point (B) providing the dynamic duration value. Use EITHER this OR comparand_B_static_value.")
-
-    @model_validator(mode='after')
-    def check_comparand_b_source(self) -> Self:
-        static_present = self.comparand_B_static_value is not None
-        point_present = self.comparand_B_point_uuid is not None
-        if static_present == point_present:
-            raise ValueError('Exactly one of "comparand_B_static_value" or "comparand_B_point_uuid" must be provided for StateTimeConstraintDefinition')
-        return self
+    comparand_B: AnyDurationComparand = Field(..., description="Duration (B, in seconds) to compare against: a static value or the value of another Point.")
 
-AnyConstraintDefinition = Union[StateTimeConstraintDefinition, ValueConstraintDefinition]
+# Tagged on 'type' so pydantic dispatches straight to the matching model instead of trying each member
+AnyConstraintDefinition = Annotated[Union[StateTimeConstraintDefinition, ValueConstraintDefinition], Field(discriminator="type")]
 
 class ConstraintDefinition(BaseModel):
     definition: AnyConstraintDefinition = Field(..., description="The specific parameters defining the constraint's logic.")
-    type: str = Field(..., description="Type of the constraint (e.g., state_time, discrete_value). Must match the type within 'definition'.")
     description: Optional[str] = Field(None, description="Overall description of this constraint instance.")
 
-    @model_validator(mode='after')
-    def check_type_match(self) -> Self:
-        if self.definition and hasattr(self.definition, 'type') and self.type != self.definition.type:
-             raise ValueError(f"Outer constraint type '{self.type}' does not match definition type '{self.definition.type}'")
-        return self
-    model_config = {"extra": "forbid"}
+    @property
+    def type(self) -> str:
+        """Type of the constraint (e.g., state_time, discrete_value), taken from 'definition'; not serialized."""
+        return self.definition.type
+    model_config = {"extra": "forbid", "frozen": True}
 
 class ConstraintGroup(BaseModel):
     id: Optional[int] = Field(None, description="Optional numeric identifier for the group.")
-    constraints: List[ConstraintDefinition] = Field(..., description="List of constraints in this group (AND logic).")
+    constraints: Tuple[ConstraintDefinition, ...] = Field(..., description="List of constraints in this group (AND logic).")
     description: Optional[str] = Field(None, description="Description of this constraint group's purpose.")
     priority: int = Field(0, description="Priority for evaluating this group (lower value = higher priority).")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
+
+def _by_priority(groups: Tuple[ConstraintGroup, ...]) -> Tuple[ConstraintGroup, ...]:
+    # Stable, so groups sharing a priority keep their YAML order
+    return tuple(sorted(groups, key=lambda group: group.priority))
 
 class TransitionDefinition(BaseModel):
-    constraint_groups: List[ConstraintGroup] = Field(...,
-        description="List of constraint groups. Transition occurs if ANY group is met (OR logic). Evaluated in priority order.")
-    model_config = {"extra": "forbid"}
+    constraint_groups: Annotated[Tuple[ConstraintGroup, ...], AfterValidator(_by_priority)] = Field(...,
+        description="List of constraint groups, stored in priority order. Transition occurs if ANY group is met (OR logic).")
+    model_config = {"extra": "forbid", "frozen": True}
+
+class TransitionRule(TransitionDefinition):
+    from_state: str = Field(..., description="Name of the state this transition leaves.")
+    to_state: str = Field(..., description="Name of the state this transition enters.")
 
 # --- PWM Output Mapping ---
+_PWM_OUTPUT_VALUE_TYPES = frozenset({ValueType.DISCRETE, ValueType.BOOLEAN})
+
 class DriverPWMOutputMapping(BaseModel):
     input_point_uuid: PointUUID = Field(..., description="UUID of the Point providing the PWM setpoint (e.g., 0.0-1.0 value).")
     output_actuator_uuid: PointUUID = Field(..., description="UUID of the ON/OFF Point controlling the physical actuator.")
     pwm_period_seconds: float = Field(..., gt=0, description="The period (in seconds) over which the PWM cycle repeats (must be > 0).")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='after')
     def check_point_types(self, info: ValidationInfo) -> Self:
@@ -129,7 +158,7 @@ class DriverPWMOutputMapping(BaseModel):
 
         output_p_def = points_map.get(self.output_actuator_uuid)
         if output_p_def:
-            if output_p_def.value_type not in [ValueType.DISCRETE, ValueType.BOOLEAN]:
+            if output_p_def.value_type not in _PWM_OUTPUT_VALUE_TYPES:
                 raise ValueError(
                     f"PWM output_actuator_uuid '{self.output_actuator_uuid}' (name: {output_p_def.name}) "
                     f"must refer to a DISCRETE or BOOLEAN point, but it is {output_p_def.value_type.value}."
@@ -145,35 +174,45 @@ class DriverPWMOutputMapping(BaseModel):
 class DriverConfig(BaseModel):
     initial_state: str = Field(..., description="The name of the state the driver should start in.")
     states: Dict[str, StateDefinition] = Field(..., description="Definitions for each possible state (map of state_name -> state_definition).")
-    transitions: Dict[str, Dict[str, TransitionDefinition]] = Field(..., description="Definitions for transitions between states.")
-    pwm_outputs: Optional[List[DriverPWMOutputMapping]] = Field(None, description="Optional list of PWM output configurations handled by this driver.")
-    model_config = {"extra": "forbid"}
+    transitions: Tuple[TransitionRule, ...] = Field(..., description="Transitions between states, one rule per (from_state, to_state) pair.")
+    pwm_outputs: Optional[Tuple[DriverPWMOutputMapping, ...]] = Field(None, description="Optional list of PWM output configurations handled by this driver.")
+    model_config = {"extra": "forbid", "frozen": True}
+
+    @cached_property
+    def transitions_by_state(self) -> Dict[str, Dict[str, TransitionRule]]:
+        """Transition rules indexed as from_state -> to_state -> rule."""
+        by_state: Dict[str, Dict[str, TransitionRule]] = {}
+        for rule in self.transitions:
+            by_state.setdefault(rule.from_state, {})[rule.to_state] = rule
+        return by_state
 
     @model_validator(mode='after')
     def check_initial_state_and_transitions(self, info: ValidationInfo) -> Self:
-        defined_state_names = set(self.states.keys()) if self.states else set()
-        if self.initial_state not in defined_state_names:
+        # Membership is checked against the states dict itself; the name set is only built for error messages
+        states = self.states or {}
+        if self.initial_state not in states:
             raise ValueError(
                 f"'initial_state' ('{self.initial_state}') is not a defined state. "
-                f"Defined states: {defined_state_names or '{}'}."
+                f"Defined states: {set(states) or '{}'}."
             )
-        if self.transitions:
-            for from_state, to_states_dict in self.transitions.items():
-                if from_state not in defined_state_names:
-                    raise ValueError(
-                        f"Transition defined FROM non-existent state '{from_state}'. "
-                        f"Defined states: {defined_state_names or '{}'}."
-                    )
-                if to_states_dict:
-                    for to_state in to_states_dict.keys():
-                        if to_state not in defined_state_names:
-                            raise ValueError(
-                                f"Transition defined FROM '{from_state}' TO non-existent state '{to_state}'. "
-                                f"Defined states: {defined_state_names or '{}'}."
-                            )
+        seen_pairs = set()
+        for rule in self.transitions:
+            if rule.from_state not in states:
+                raise ValueError(
+                    f"Transition defined FROM non-existent state '{rule.from_state}'. "
+                    f"Defined states: {set(states) or '{}'}."
+                )
+            if rule.to_state not in states:
+                raise ValueError(
+                    f"Transition defined FROM '{rule.from_state}' TO non-existent state '{rule.to_state}'. "
+                    f"Defined states: {set(states) or '{}'}."
+                )
+            pair = (rule.from_state, rule.to_state)
+            if pair in seen_pairs:
+                raise ValueError(f"Transition FROM '{rule.from_state}' TO '{rule.to_state}' is defined more than once.")
+            seen_pairs.add(pair)
         return self
 
-
 # ==============================================================================
 # === MICROCONTROLLER HARDWARE POINTS MODELS (NEW) ===========================
 # ==============================================================================
@@ -182,7 +221,7 @@ class DriverConfig(BaseModel):
 class WiFiConfig(BaseModel):
     ssid: str = Field(..., description="WiFi network SSID. Resolved from secrets; not allowed in tracked YAML.")
     password: str = Field(..., description="WiFi network password. Resolved from secrets; not allowed in tracked YAML.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='before')
     @classmethod
@@ -206,26 +245,26 @@ class MQTTBrokerConfigOptional(BaseModel):
     port: Optional[int] = Field(None, description="MQTT broker port. If not provided, uses global setting.")
     username: Optional[str] = Field(None, description="MQTT username. If not provided, uses global setting.")
     password: Optional[str] = Field(None, description="MQTT password. If not provided, uses global setting.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class NTPServerConfigOptional(BaseModel):
     address: Optional[str] = Field(None, description="NTP server address. If not provided, uses global setting.")
     utc_offset_seconds: Optional[int] = Field(None, description="UTC offset in seconds. If not provided, uses global setting.")
     update_interval_ms: Optional[int] = Field(None, description="NTP update interval in milliseconds. If not provided, uses global setting.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class NTPServerConfig(BaseModel):
     address: str = Field(..., description="NTP server address")
     utc_offset_seconds: int = Field(..., description="UTC offset in seconds")
     update_interval_ms: int = Field(..., description="NTP update interval in milliseconds")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class TimingConstants(BaseModel):
     publish_interval_ms: int = Field(..., gt=0, description="Sensor publish interval in milliseconds (e.g., 15000 for 15 seconds).")
     wifi_connect_timeout_ms: Optional[int] = Field(30000, gt=0, description="WiFi connection timeout in milliseconds.")
     mqtt_connect_timeout_ms: Optional[int] = Field(20000, gt=0, description="MQTT connection timeout in milliseconds.")
     ntp_sync_timeout_ms: Optional[int] = Field(15000, gt=0, description="NTP synchronization timeout in milliseconds.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class MicrocontrollerTimingConstants(BaseModel):
     """FSM and logic-specific timing constants for microcontroller behavior."""
@@ -251,13 +290,13 @@ class MicrocontrollerTimingConstants(BaseModel):
     ntp_loop_update_interval_ms: int = Field(60000, gt=0, description="Interval for NTP updates in main loop (milliseconds).")
     debug_queue_interval_ms: int = Field(30000, gt=0, description="Interval for debug queue status prints (milliseconds).")
     
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # --- Hardware Point Base Classes ---
 class HardwarePointBase_MicrocontrollerImpl(BaseModel):
     name: str = Field(..., description="Logical name for this hardware point (used for C++ define prefixes).")
     point_kind: str = Field(..., description="Type of hardware point (actuator, sensor_data, system_info).")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class ActuatorHardwarePoint_MicrocontrollerImpl(HardwarePointBase_MicrocontrollerImpl):
     point_kind: Literal["actuator"] = Field("actuator", description="Type indicator for actuator hardware points.")
@@ -266,7 +305,7 @@ class ActuatorHardwarePoint_MicrocontrollerImpl(HardwarePointBase_Microcontrolle
     pin: int = Field(..., description="GPIO pin number for this actuator.")
     pin_mode: Literal["OUTPUT"] = Field("OUTPUT", description="Pin mode (OUTPUT for actuators).")
     initial_state: Literal["HIGH", "LOW"] = Field("LOW", description="Initial pin state on startup.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class SensorDataHardwarePoint_MicrocontrollerImpl(HardwarePointBase_MicrocontrollerImpl):
     point_kind: Literal["sensor_data"] = Field("sensor_data", description="Type indicator for sensor data hardware points.")
@@ -274,12 +313,12 @@ class SensorDataHardwarePoint_MicrocontrollerImpl(HardwarePointBase_Microcontrol
     pin: Optional[int] = Field(None, description="GPIO pin number if applicable (e.g., for DHT sensors).")
     pin_mode: Optional[Literal["INPUT", "INPUT_PULLUP"]] = Field(None, description="Pin mode if applicable.")
     attributes: Optional[Dict[str, Any]] = Field(None, description="Additional sensor-specific attributes (e.g., I2C address, sensor model).")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class SystemInfoHardwarePoint_MicrocontrollerImpl(HardwarePointBase_MicrocontrollerImpl):
     point_kind: Literal["system_info"] = Field("system_info", description="Type indicator for system info hardware points.")
     data_point_uuid_ref: PointUUID = Field(..., description="UUID of the system status point that this provides.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # Union type for all hardware points
 AnyHardwarePoint_MicrocontrollerImpl = Union[
@@ -292,67 +331,73 @@ AnyHardwarePoint_MicrocontrollerImpl = Union[
 # === MICROCONTROLLER AND GOVERNOR MODELS (UPDATED) ==========================
 # ==============================================================================
 
+def _parse_i2c_address(value: Any) -> Any:
+    # YAML hex literals already load as int; quoted forms like "0x44" are parsed here
+    return int(value, 0) if isinstance(value, str) else value
+
+I2CAddress = Annotated[int, BeforeValidator(_parse_i2c_address)]
+
 # --- Microcontroller Supporting Sub-Models (Legacy) ---
 class I2CConfig(BaseModel):
     sda_pin: int = Field(..., description="GPIO pin number for I2C SDA.")
     scl_pin: int = Field(..., description="GPIO pin number for I2C SCL.")
     clock_speed: Optional[int] = Field(None, description="Optional I2C clock speed in Hz (e.g., 100000).")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class I2CDevice(BaseModel):
     sensor_model: Literal["SHT85", "BME280", "SCD41", "SHT31", "SHT40", "MCP23017"] = Field(...,
         description="Specific model of the sensor/device (e.g., 'SHT85', 'BME280').")
-    address: Union[int, str] = Field(..., description="I2C address (e.g., 0x44 or 68).")
+    address: I2CAddress = Field(..., description="I2C address (e.g., 0x44 or 68).")
     point_uuids: Dict[Literal["temperature", "humidity", "co2", "pressure"], PointUUID] = Field(...,
         description="Mapping of measurement type (e.g., 'temperature', 'humidity') to Point UUID.")
     settings: Optional[Dict[str, Any]] = Field(None, description="Optional device-specific settings (e.g., {'automatic_self_calibration': False}).")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class OneWireConfig(BaseModel):
     pin: int = Field(..., description="GPIO pin number for the OneWire bus.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class OneWireDevice(BaseModel):
     sensor_model: Literal["DS18B20"]
     pin: int = Field(..., description="GPIO pin number for this OneWire device's bus.")
     point_uuid: PointUUID = Field(..., description="Point UUID for the temperature reading from this sensor.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class DHTSensorConfig(BaseModel):
     sensor_model: Literal["DHT11", "DHT22"] = Field(..., description="Specific model of the DHT sensor ('DHT11' or 'DHT22').")
     pin: int = Field(..., description="GPIO pin number connected to the DHT sensor.")
     point_uuids: Dict[Literal["temperature", "humidity"], PointUUID] = Field(...,
         description="Mapping of measurement type to Point UUID.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class DigitalOutputConfig(BaseModel):
     pin: int = Field(..., description="GPIO pin number for the digital output.")
     name: Optional[str] = Field(None, description="Logical name for this output (e.g., 'MisterRelay').")
     point_uuid: PointUUID = Field(..., description="Point UUID for the command/status of this output.")
     initial_state: Optional[Literal["on", "off"]] = Field("off", description="Initial state on startup ('on' or 'off').")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # Enhanced sensor configuration models for C struct generation
 class SHT85SensorConfig(BaseModel):
     type: Literal["SHT85"] = Field("SHT85", description="Sensor type")
     instance_name: str = Field(..., description="C variable instance name (e.g., 'SHT85_0')")
-    address: int = Field(..., description="I2C address")
+    address: I2CAddress = Field(..., description="I2C address")
     point_name: str = Field(..., description="Point name for the sensor")
     temperature_uuid: PointUUID = Field(..., description="Temperature point UUID")
     humidity_uuid: PointUUID = Field(..., description="Humidity point UUID")
     c_to_f: bool = Field(True, description="Convert Celsius to Fahrenheit")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class BME280SensorConfig(BaseModel):
     type: Literal["BME280"] = Field("BME280", description="Sensor type")
     instance_name: str = Field(..., description="C variable instance name (e.g., 'BME280_1')")
-    address: int = Field(..., description="I2C address")
+    address: I2CAddress = Field(..., description="I2C address")
     point_name: str = Field(..., description="Point name for the sensor")
     temperature_uuid: PointUUID = Field(..., description="Temperature point UUID")
     humidity_uuid: PointUUID = Field(..., description="Humidity point UUID")
     pressure_uuid: PointUUID = Field(..., description="Pressure point UUID")
     c_to_f: bool = Field(True, description="Convert Celsius to Fahrenheit")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class DHT22SensorConfig(BaseModel):
     type: Literal["DHT22"] = Field("DHT22", description="Sensor type")
@@ -362,7 +407,7 @@ class DHT22SensorConfig(BaseModel):
     temperature_uuid: PointUUID = Field(..., description="Temperature point UUID")
     humidity_uuid: PointUUID = Field(..., description="Humidity point UUID")
     c_to_f: bool = Field(True, description="Convert Celsius to Fahrenheit")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class DS18B20SensorConfig(BaseModel):
     type: Literal["DS18B20"] = Field("DS18B20", description="Sensor type")
@@ -372,12 +417,12 @@ class DS18B20SensorConfig(BaseModel):
     temperature_uuid: PointUUID = Field(..., description="Temperature point UUID")
     resolution_bits: int = Field(10, description="DS18B20 resolution in bits")
     c_to_f: bool = Field(True, description="Convert Celsius to Fahrenheit")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # FSM Configuration
 class FSMConfig(BaseModel):
     states: List[str] = Field(..., description="List of FSM state names")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # Comprehensive timing constants
 class ComprehensiveTimingConstants(BaseModel):
@@ -411,30 +456,30 @@ class ComprehensiveTimingConstants(BaseModel):
     
     # Actuator-specific timing
     output_republish_frequency_ms: Optional[int] = Field(None, description="Actuator status republish frequency")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # Status points configuration
 class StatusPointConfig(BaseModel):
     point_name: str = Field(..., description="Point name")
     uuid: PointUUID = Field(..., description="Point UUID")
     topic: str = Field(..., description="MQTT topic")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 class StatusPointsConfig(BaseModel):
     wifi_uptime: StatusPointConfig = Field(..., description="WiFi uptime status point")
     last_restart_reason: StatusPointConfig = Field(..., description="Last restart reason status point")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # Debug configuration
 class DebugConfig(BaseModel):
     i2c_scan_on_startup: bool = Field(True, description="Enable I2C scan on startup")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # SCD4X sensor configuration
 class SCD4XSensorConfig(BaseModel):
     type: Literal["SCD4X"] = Field("SCD4X", description="SCD4X sensor type")
     instance_name: str = Field(..., description="C variable instance name (e.g., 'SCD4X_0')")
-    address: int = Field(..., description="I2C address")
+    address: I2CAddress = Field(..., description="I2C address")
     point_name: str = Field(..., description="Base point name for the sensor")
     co2_topic: str = Field(..., description="MQTT topic for CO2 data")
     co2_uuid: PointUUID = Field(..., description="CO2 point UUID")
@@ -443,7 +488,7 @@ class SCD4XSensorConfig(BaseModel):
     humidity_topic: str = Field(..., description="MQTT topic for humidity data")
     humidity_uuid: PointUUID = Field(..., description="Humidity point UUID")
     c_to_f: bool = Field(True, description="Convert Celsius to Fahrenheit")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # Actuator configuration
 class ActuatorConfig(BaseModel):
@@ -456,7 +501,7 @@ class ActuatorConfig(BaseModel):
     readback_uuid: PointUUID = Field(..., description="Readback point UUID")
     pin_mode: Literal["OUTPUT"] = Field("OUTPUT", description="Pin mode")
     initial_state: Literal["LOW", "HIGH"] = Field("LOW", description="Initial pin state")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
 # MQTT configuration with client_id
 class MQTTConfigWithClientId(BaseModel):
@@ -465,7 +510,7 @@ class MQTTConfigWithClientId(BaseModel):
     username: str = Field(..., description="MQTT username. Resolved from secrets; not allowed in tracked YAML.")
     password: str = Field(..., description="MQTT password. Resolved from secrets; not allowed in tracked YAML.")
     client_id: str = Field(..., description="MQTT client ID")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='before')
     @classmethod
@@ -522,7 +567,7 @@ class MicrocontrollerConfig(BaseModel):
     digital_outputs: Optional[List[DigitalOutputConfig]] = Field(None, description="Legacy digital outputs")
     publish_frequency_ms: Optional[int] = Field(None, description="Legacy publish frequency")
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='before')
     @classmethod
@@ -583,7 +628,7 @@ class BangBangControllerConfig(_BaseGovernorControllerConfig):
     target_setpoint_point_uuid: PointUUID = Field(..., description="UUID of the Point providing the desired target value.")
     hysteresis_point_uuid: PointUUID = Field(..., description="UUID of the Point providing the hysteresis value (deadband).")
     output_command_point_uuid: PointUUID = Field(..., description="UUID of the Point where the Governor writes the calculated command ('on' or 'off').")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='after')
     def check_point_config(self, info: ValidationInfo) -> Self:
@@ -614,7 +659,7 @@ class PIDControllerConfig(_BaseGovernorControllerConfig):
     min_output: float = Field(0.0, ge=0.0, le=1.0, description="Minimum output clamp value (usually 0.0).")
     max_output: float = Field(1.0, ge=0.0, le=1.0, description="Maximum output clamp value (usually 1.0).")
     pwm_period_seconds: float = Field(..., gt=0, description="The PWM period this PID loop targets (used to calculate ON/OFF durations). Must match the corresponding Driver's PWM configuration period.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='after')
     def check_point_config(self, info: ValidationInfo) -> Self:
@@ -640,7 +685,7 @@ class TimeScheduleControllerConfig(_BaseGovernorControllerConfig):
     off_interval_minutes_point_uuid: PointUUID = Field(..., description="UUID of the Point providing the OFF duration in minutes.")
     output_command_point_uuid: PointUUID = Field(..., description="UUID of the Point where the Governor writes the calculated command ('on' or 'off').")
     initial_phase: Optional[Literal["on", "off"]] = Field("off", description="The initial phase of the cycle on startup.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @model_validator(mode='after')
     def check_point_config(self, info: ValidationInfo) -> Self:
@@ -656,10 +701,10 @@ class TimeScheduleControllerConfig(_BaseGovernorControllerConfig):
             raise ValueError(". ".join(all_errors))
         return self
 
-AnyControllerConfig = Union[PIDControllerConfig, BangBangControllerConfig, TimeScheduleControllerConfig]
+AnyControllerConfig = Annotated[Union[PIDControllerConfig, BangBangControllerConfig, TimeScheduleControllerConfig], Field(discriminator="controller_type")]
 
 class GovernorConfig(BaseModel):
     update_interval_seconds: float = Field(10.0, gt=0, description="How often the Governor runs its control logic loop (in seconds).")
-    controllers: List[AnyControllerConfig] = Field(...,
+    controllers: Tuple[AnyControllerConfig, ...] = Field(...,
         description="List of control loops (e.g., PID, Bang-Bang) managed by this Governor. The 'controller_type' field determines the specific parameters required for each.")
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
@@ -1,17 +1,24 @@
 # common/config_models/core_ssot_models.py
 
 import enum
-from typing import Any, Dict, List, Optional, Union, Literal
-from pydantic import BaseModel, Field, validator, model_validator # validator might not be needed if reverting PointDefinition changes
+import sys
+from typing import Annotated, Any, Dict, List, Optional, Union, Literal
+from pydantic import BaseModel, Field, TypeAdapter, validator, model_validator # validator might not be needed if reverting PointDefinition changes
 from pydantic_core import core_schema
 from pydantic.annotated_handlers import GetCoreSchemaHandler # For PointUUID
 
 # --- Custom Type for Point UUIDs ---
+_POINT_UUID_PATTERN = r"^[0-9A-Za-z_-]+$"
+
 class PointUUID(str):
     """
     Custom type for Point UUIDs. It's fundamentally a string,
     but this distinct type allows for semantic clarity and easier
-    identification in model processing.
+    identification in model processing. Validated values are interned, so
+    the same UUID referenced from many configs shares one string object.
+
+    The pattern accepts canonical UUIDs as well as the readable slugs used by
+    the example configs, and rejects empty values and stray whitespace.
     """
     @classmethod
     def __get_pydantic_core_schema__(
@@ -19,7 +26,7 @@ class PointUUID(str):
         source_type: Any,
         handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.str_schema()
+        return core_schema.no_info_after_validator_function(sys.intern, core_schema.str_schema(pattern=_POINT_UUID_PATTERN))
 
 # --- Enums for controlled vocabulary (as per original uploaded file) ---
 class ValueType(str, enum.Enum):
@@ -173,12 +180,16 @@ class ManualSourceComponentDefinition(ComponentDefinition):
     virtual_points_provided: Optional[List[PointUUID]] = Field([], description="List of point UUIDs considered to be provided/sourced by manual input.")
 
 # --- Main System Definition ---
-AnyComponent = Union[
-    MicrocontrollerComponentDefinition,
-    DriverComponentDefinition,
-    GovernorComponentDefinition,
-    ManualSourceComponentDefinition
-    # DataProcessorComponentDefinition - Removed if not in original
+# Tagged on 'type' so each component entry is validated against exactly one definition
+AnyComponent = Annotated[
+    Union[
+        MicrocontrollerComponentDefinition,
+        DriverComponentDefinition,
+        GovernorComponentDefinition,
+        ManualSourceComponentDefinition,
+        # DataProcessorComponentDefinition - Removed if not in original
+    ],
+    Field(discriminator="type"),
 ]
 
 class SystemDefinition(BaseModel):
@@ -188,3 +199,11 @@ class SystemDefinition(BaseModel):
     points: List[PointDefinition] = Field(..., description="Master list of all logical points in the system.")
     components: List[AnyComponent] = Field(..., description="List of all running component instances.")
     model_config = {"extra": "forbid"}
+
+# Built once per process; SSOT loaders validate through this rather than SystemDefinition(**data)
+SYSTEM_ADAPTER: TypeAdapter[SystemDefinition] = TypeAdapter(SystemDefinition)
+
+
+def validate_system_python(data: Any) -> SystemDefinition:
+    """Validate a parsed SSOT document (e.g. loaded YAML) into a SystemDefinition."""
+    return SYSTEM_ADAPTER.validate_python(data)
@@ -2,5 +2,89 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT))
\ No newline at end of file
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared_libs.config_models.component_configs import DriverConfig  # noqa: E402
+from shared_libs.config_models.core_ssot_models import SystemDefinition  # noqa: E402
+
+
+def _point(uuid: str, name: str, **extra) -> dict:
+    point = {
+        "uuid": uuid,
+        "name": name,
+        "value_type": "CONTINUOUS",
+        "units": "degF",
+        "data_source_layer": "microcontroller",
+        "access": "READ_ONLY",
+        "function_grouping": "sensor",
+        "topic_originator_slug": name.lower(),
+    }
+    point.update(extra)
+    return point
+
+
+def _system(points: list, components: list) -> SystemDefinition:
+    return SystemDefinition.model_validate({
+        "global_settings": {
+            "mqtt_topic_prefix": "mush/",
+            "wifi": {"ssid": "s", "password": "p"},
+            "mqtt_broker": {"address": "localhost"},
+            "ntp_server": {},
+        },
+        "command_hierarchy": ["manual", "governor", "driver"],
+        "points": points,
+        "components": components,
+    })
+
+
+def _driver_config() -> DriverConfig:
+    return DriverConfig.model_validate({
+        "initial_state": "off",
+        "states": {
+            "off": {
+                "defining_conditions": [{"point_uuid": "state-uuid", "expected_value": "off"}],
+                "entry_actions": [{"point_uuid": "write-uuid", "value": "off"}],
+            },
+            "on": {
+                "defining_conditions": [{"point_uuid": "state-uuid", "expected_value": "on"}],
+            },
+        },
+        "transitions": [{
+            "from_state": "off",
+            "to_state": "on",
+            "constraint_groups": [{
+                "constraints": [{
+                    "definition": {
+                        "type": "state_time",
+                        "value_A_point_uuid": "time-uuid",
+                        "comparand_B": {"source": "point", "point_uuid": "duration-uuid"},
+                    },
+                }],
+            }],
+        }],
+        "pwm_outputs": [{
+            "input_point_uuid": "pwm-in-uuid",
+            "output_actuator_uuid": "pwm-out-uuid",
+            "pwm_period_seconds": 10,
+        }],
+    })
+
+
+@pytest.fixture
+def make_point():
+    """Builder for raw SSOT point dicts: make_point(uuid, name, **overrides)."""
+    return _point
+
+
+@pytest.fixture
+def make_system():
+    """Builder for a validated SystemDefinition: make_system(points, components)."""
+    return _system
+
+
+@pytest.fixture
+def driver_config() -> DriverConfig:
+    return _driver_config()
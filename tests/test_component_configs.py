@@ -0,0 +1,115 @@
+import pytest
+from pydantic import ValidationError
+
+from shared_libs.config_models.component_configs import (
+    ComparatorType,
+    ConstraintDefinition,
+    DriverConfig,
+    I2CDevice,
+    StateCondition,
+    StateTimeConstraintDefinition,
+    TransitionDefinition,
+    ValueConstraintDefinition,
+)
+
+
+def test_constraint_definition_dispatches_on_type():
+    state_time = ConstraintDefinition.model_validate({
+        "definition": {"type": "state_time", "value_A_point_uuid": "a", "comparand_B": {"source": "static", "value": 5}},
+    })
+    value = ConstraintDefinition.model_validate({
+        "definition": {"type": "discrete_value", "value_A_point_uuid": "a", "comparator": "==", "comparand_B": {"source": "static", "value": "on"}},
+    })
+    assert isinstance(state_time.definition, StateTimeConstraintDefinition)
+    assert isinstance(value.definition, ValueConstraintDefinition)
+    assert (state_time.type, value.type) == ("state_time", "discrete_value")
+
+
+def test_unknown_constraint_type_names_the_tag():
+    with pytest.raises(ValidationError) as exc_info:
+        ConstraintDefinition.model_validate({
+            "definition": {"type": "bogus", "value_A_point_uuid": "a"},
+        })
+    assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
+
+
+def test_comparand_needs_exactly_one_source():
+    definition = {"type": "discrete_value", "value_A_point_uuid": "a", "comparator": "=="}
+    point = ConstraintDefinition.model_validate({
+        "definition": {**definition, "comparand_B": {"source": "point", "point_uuid": "b"}},
+    })
+    assert point.definition.comparand_B.point_uuid == "b"
+
+    for comparand in ({"source": "point", "point_uuid": "b", "value": "on"}, {"value": "on"}):
+        with pytest.raises(ValidationError):
+            ConstraintDefinition.model_validate({"definition": {**definition, "comparand_B": comparand}})
+
+
+def test_transition_rules_are_indexed_and_unique():
+    rule = {"from_state": "off", "to_state": "on", "constraint_groups": []}
+    data = {
+        "initial_state": "off",
+        "states": {"off": {"defining_conditions": []}, "on": {"defining_conditions": []}},
+        "transitions": [rule],
+    }
+    config = DriverConfig.model_validate(data)
+    assert config.transitions_by_state["off"]["on"] is config.transitions[0]
+
+    with pytest.raises(ValidationError, match="defined more than once"):
+        DriverConfig.model_validate({**data, "transitions": [rule, rule]})
+
+
+def test_validated_configs_are_read_only():
+    config = DriverConfig.model_validate({"initial_state": "off", "states": {"off": {"defining_conditions": []}}, "transitions": []})
+    with pytest.raises(ValidationError):
+        config.initial_state = "on"
+
+
+def test_comparator_operator_table():
+    assert ComparatorType.GE.operator(5, 5) and not ComparatorType.GT.operator(5, 5)
+    assert ComparatorType.EQ.operator("on", "on") and ComparatorType.NE.operator("on", "off")
+    assert all(c.operator for c in ComparatorType)
+
+
+def test_point_values_keep_their_scalar_type():
+    condition = StateCondition.model_validate({"point_uuid": "a", "expected_value": "1"})
+    assert condition.expected_value == "1"
+    assert StateCondition.model_validate({"point_uuid": "a", "expected_value": True}).expected_value is True
+    with pytest.raises(ValidationError):
+        StateCondition.model_validate({"point_uuid": "a", "expected_value": None})
+
+
+def test_i2c_address_accepts_hex_strings():
+    device = {"sensor_model": "SHT85", "point_uuids": {"temperature": "t"}}
+    assert I2CDevice.model_validate({**device, "address": "0x44"}).address == 0x44
+    assert I2CDevice.model_validate({**device, "address": 68}).address == 68
+    with pytest.raises(ValidationError):
+        I2CDevice.model_validate({**device, "address": "sixty-eight"})
+
+
+def test_point_uuids_are_interned():
+    uuid = "".join(["shared-", "uuid"])  # built at runtime so it is not interned already
+    first = StateCondition.model_validate({"point_uuid": uuid, "expected_value": "on"})
+    second = StateCondition.model_validate({"point_uuid": "".join(["shared-", "uuid"]), "expected_value": "on"})
+    assert first.point_uuid is second.point_uuid
+
+
+def test_constraint_groups_are_stored_in_priority_order():
+    groups = [
+        {"description": "late", "priority": 10, "constraints": []},
+        {"description": "first", "priority": 0, "constraints": []},
+        {"description": "second", "priority": 0, "constraints": []},
+    ]
+    transition = TransitionDefinition.model_validate({"constraint_groups": groups})
+    assert [g.description for g in transition.constraint_groups] == ["first", "second", "late"]
+
+
+@pytest.mark.parametrize("uuid", ["", "heater uuid", " 6c22f1a2-b3c4-4d5e-6f70-8192a3b4c5e7"])
+def test_malformed_point_uuids_are_rejected(uuid):
+    with pytest.raises(ValidationError):
+        StateCondition.model_validate({"point_uuid": uuid, "expected_value": "on"})
+
+
+def test_driver_config_round_trips_through_its_dump(driver_config):
+    assert DriverConfig.model_validate(driver_config.model_dump()) == driver_config
+    assert DriverConfig.model_validate_json(driver_config.model_dump_json()) == driver_config
@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from shared_libs.config_models.core_ssot_models import (
+    DriverComponentDefinition,
+    GovernorComponentDefinition,
+    validate_system_python,
+)
+
+
+def test_components_dispatch_on_type(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp")],
+        [
+            {"id": "d1", "type": "driver", "controls_microcontroller": "c1"},
+            {"id": "g1", "type": "governor", "controls_drivers": ["d1"]},
+        ],
+    )
+    assert [type(c) for c in system.components] == [DriverComponentDefinition, GovernorComponentDefinition]
+
+
+def test_component_type_is_required(make_point, make_system):
+    with pytest.raises(ValidationError) as exc_info:
+        make_system([make_point("u1", "Temp")], [{"id": "c1", "points_provided": ["u1"]}])
+    assert exc_info.value.errors()[0]["type"] == "union_tag_not_found"
+
+
+def test_validate_system_python_rejects_non_mapping_documents():
+    with pytest.raises(ValidationError):
+        validate_system_python(["not", "a", "mapping"])
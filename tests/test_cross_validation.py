@@ -0,0 +1,108 @@
+from mushbuild.validation.cross import CrossValidator
+
+
+def _categories(report) -> set:
+    return {category for category, _ in report.errors}
+
+
+def test_valid_system_passes(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp"), make_point("u2", "Humidity")],
+        [{"id": "c1", "type": "microcontroller", "points_provided": ["u1", "u2"]}],
+    )
+    report = CrossValidator(system).validate({})
+    assert report.ok, report.render()
+
+
+def test_duplicate_names_and_ids_are_reported(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp"), make_point("u2", "Temp")],
+        [
+            {"id": "c1", "type": "microcontroller", "points_provided": ["u1"]},
+            {"id": "c1", "type": "microcontroller", "points_provided": ["u2"]},
+        ],
+    )
+    report = CrossValidator(system).validate({})
+    assert not report.ok
+    messages = [msg for category, msg in report.errors if category == "uniqueness"]
+    assert any("'Temp'" in msg for msg in messages)
+    assert any("'c1'" in msg for msg in messages)
+
+
+def test_orphaned_and_multiply_provided_points_are_reported(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp"), make_point("u2", "Humidity")],
+        [
+            {"id": "c1", "type": "microcontroller", "points_provided": ["u1"]},
+            {"id": "c2", "type": "microcontroller", "points_provided": ["u1"]},
+        ],
+    )
+    report = CrossValidator(system).validate({})
+    assert {"orphaned_points", "multiply_provided_points"} <= _categories(report)
+
+
+def test_undefined_point_uuid_references_are_reported(make_point, make_system, driver_config):
+    system = make_system(
+        [make_point("state-uuid", "State")],
+        [
+            {"id": "c1", "type": "microcontroller", "points_provided": []},
+            {"id": "d1", "type": "driver", "controls_microcontroller": "c1", "virtual_points_provided": ["state-uuid"]},
+        ],
+    )
+    report = CrossValidator(system).validate({"d1": driver_config})
+    messages = [msg for category, msg in report.errors if category == "point_uuid_ref"]
+    assert messages and all("'d1'" in msg for msg in messages)
+    assert not any("'state-uuid'" in msg for msg in messages)
+
+
+def test_invalid_readback_links_are_reported(make_point, make_system):
+    system = make_system(
+        [
+            make_point("u1", "Temp", readback_point_uuid="u1"),
+            make_point("u2", "Humidity", readback_point_uuid="missing"),
+        ],
+        [{"id": "c1", "type": "microcontroller", "points_provided": ["u1", "u2"]}],
+    )
+    report = CrossValidator(system).validate({})
+    messages = [msg for category, msg in report.errors if category == "command_readback_link"]
+    assert len(messages) == 2
+
+
+def test_undefined_controls_references_are_reported(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp")],
+        [
+            {"id": "c1", "type": "microcontroller", "points_provided": ["u1"]},
+            {"id": "d1", "type": "driver", "controls_microcontroller": "missing-mc"},
+            {"id": "g1", "type": "governor", "controls_drivers": ["d1", "missing-driver"]},
+        ],
+    )
+    report = CrossValidator(system).validate({})
+    messages = [msg for category, msg in report.errors if category == "component_id_ref"]
+    assert messages == [
+        "DriverComponent 'd1' 'controls_microcontroller' references undefined component ID 'missing-mc'.",
+        "GovernorComponent 'g1' 'controls_drivers' references undefined component ID 'missing-driver'.",
+    ]
+
+
+def test_multiply_provided_points_name_their_providers(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp")],
+        [
+            {"id": "c1", "type": "microcontroller", "points_provided": ["u1"]},
+            {"id": "c2", "type": "microcontroller", "points_provided": ["u1"]},
+        ],
+    )
+    report = CrossValidator(system).validate({})
+    messages = [msg for category, msg in report.errors if category == "multiply_provided_points"]
+    assert messages == ["Point UUID 'u1' is provided by multiple components: ['c1', 'c2']."]
+
+
+def test_provided_points_missing_from_ssot_are_reported(make_point, make_system):
+    system = make_system(
+        [make_point("u1", "Temp")],
+        [{"id": "c1", "type": "microcontroller", "points_provided": ["u1", "ghost"]}],
+    )
+    report = CrossValidator(system).validate({})
+    messages = [msg for category, msg in report.errors if category == "point_provision"]
+    assert messages == ["Point UUID 'ghost' provided by ['c1'] is not defined in SSOT points."]
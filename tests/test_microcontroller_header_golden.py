@@ -57,12 +57,12 @@ def test_micro_header_matches_artifact(tmp_path: Path, micro_id: str):
     infra, secrets_model = _load_infrastructure_with_secrets(config_base_dir)
 
     ssot_file = config_base_dir / "system_definition.yaml"
-    ssot = SSOTValidator(ssot_file).validate()
-    assert ssot is not None
+    ssot_report, ssot = SSOTValidator(ssot_file).validate()
+    assert ssot is not None, ssot_report.render()
 
     points_by_uuid_map = {p.uuid: p for p in ssot.points}
-    ok, validated = ComponentConfigValidator(ssot, config_base_dir, infra, secrets_model).validate(points_by_uuid_map)
-    assert ok
+    report, validated = ComponentConfigValidator(ssot, config_base_dir, infra, secrets_model).validate(points_by_uuid_map)
+    assert report.ok, report.render()
     assert micro_id in validated
 
     out_dir = tmp_path / "generated"
@@ -0,0 +1,29 @@
+import json
+
+from mushbuild.generators.points_registry import PointsRegistryGenerator
+
+
+def test_streamed_registry_matches_indented_json(tmp_path, make_point, make_system):
+    system = make_system(
+        [
+            make_point("u1", "Temp", validation_rules={"min_value": 0, "max_value": 100}),
+            make_point("u2", "Humidity", description="Line one\nline two, 50 °F – Température", writable_by=["c1"]),
+        ],
+        [{"id": "c1", "type": "microcontroller", "points_provided": ["u1", "u2"]}],
+    )
+    out = tmp_path / "registry.json"
+    assert PointsRegistryGenerator(system, out).generate()
+
+    text = out.read_text()
+    registry = json.loads(text)
+    assert text == json.dumps(registry, indent=2)
+    assert text.isascii() and "\\u00b0F" in text
+    assert list(registry["points"]) == ["u1", "u2"]
+    assert registry["points"]["u1"]["mqtt_topic"] == "mush/c1/sensors/temp/degf"
+
+
+def test_empty_registry_is_valid_json(tmp_path, make_system):
+    out = tmp_path / "registry.json"
+    assert PointsRegistryGenerator(make_system([], []), out).generate()
+    assert json.loads(out.read_text())["points"] == {}
+    assert out.read_text() == json.dumps(json.loads(out.read_text()), indent=2)
@@ -0,0 +1,37 @@
+import pytest
+
+from mushbuild.utils.topics import TopicGenerator
+
+
+@pytest.fixture
+def topic_generator(make_point, make_system):
+    system = make_system(
+        [
+            make_point("s1", "Temp", units="Deg F"),
+            make_point("a1", "Fan", function_grouping="actuator", topic_device_slug="fan"),
+            make_point("st1", "State", function_grouping="status", topic_status_slug="state", data_source_layer="driver"),
+            make_point("cmd1", "FanCmd", function_grouping="command", topic_directive_slug="fan", data_source_layer="driver"),
+        ],
+        [
+            {"id": "c1", "type": "microcontroller", "points_provided": ["s1", "a1"]},
+            {"id": "d1", "type": "driver", "controls_microcontroller": "c1", "virtual_points_provided": ["st1", "cmd1"]},
+        ],
+    )
+    return TopicGenerator(system), {p.uuid: p for p in system.points}
+
+
+def test_topics_for_each_function_grouping(topic_generator):
+    generator, points = topic_generator
+    assert generator.generate_topic_for_point(points["s1"]) == "mush/c1/sensors/temp/deg_f"
+    assert generator.generate_topic_for_point(points["a1"]) == "mush/c1/actuators/fan/readback"
+    assert generator.generate_topic_for_point(points["st1"]) == "mush/d1/statuses/state"
+    assert generator.generate_topic_for_point(points["cmd1"]) == "mush/d1/commands/c1/fan/write"
+
+
+def test_generate_all_topics_is_memoized_and_read_only(topic_generator):
+    generator, points = topic_generator
+    topics = generator.generate_all_topics()
+    assert generator.generate_all_topics() is topics
+    assert set(topics) == set(points)
+    with pytest.raises(TypeError):
+        topics["s1"] = "other"
@@ -0,0 +1,29 @@
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
+from mushbuild.utils.uuid_utils import UUIDUtils
+from shared_libs.config_models.core_ssot_models import PointUUID
+
+
+def test_extracts_uuids_from_nested_dicts_and_optional_lists(driver_config):
+    uuids = UUIDUtils.extract_point_uuids(driver_config)
+    assert uuids == {
+        "state-uuid",
+        "write-uuid",
+        "time-uuid",
+        "duration-uuid",
+        "pwm-in-uuid",
+        "pwm-out-uuid",
+    }
+
+
+class _TupleUUIDs(BaseModel):
+    required: Tuple[PointUUID, ...]
+    optional: Optional[Tuple[PointUUID, ...]] = None
+    pair: Tuple[PointUUID, PointUUID] = ("pair-a", "pair-b")
+
+
+def test_extracts_uuids_from_tuple_fields():
+    model = _TupleUUIDs(required=("req-1", "req-2"), optional=("opt-1",))
+    assert UUIDUtils.extract_point_uuids(model) == {"req-1", "req-2", "opt-1", "pair-a", "pair-b"}
@@ -0,0 +1,35 @@
+from mushbuild.validation.cache import ValidationCache
+from shared_libs.config_models.component_configs import DriverConfig
+
+
+def test_round_trip_and_key_scoping(tmp_path):
+    cache = ValidationCache(tmp_path, b"context-a")
+    key = cache.key(b"initial_state: off\n", DriverConfig, "d1")
+    assert cache.load(key) is None
+
+    cache.store(key, {"validated": True})
+    assert cache.load(key) == {"validated": True}
+
+    # Same bytes under a different component or validation context must miss
+    assert cache.key(b"initial_state: off\n", DriverConfig, "d2") != key
+    assert ValidationCache(tmp_path, b"context-b").key(b"initial_state: off\n", DriverConfig, "d1") != key
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ValidationCache(tmp_path)
+    key = cache.key(b"x", DriverConfig)
+    (tmp_path / f"{key}.pkl").write_bytes(b"not a pickle")
+    assert cache.load(key) is None
+
+
+def test_key_changes_when_a_sibling_model_module_changes(tmp_path, monkeypatch):
+    package = tmp_path / "models"
+    package.mkdir()
+    (package / "component.py").write_text("# component models\n")
+    shared = package / "shared.py"
+    shared.write_text("# shared types\n")
+    monkeypatch.setattr("inspect.getsourcefile", lambda model: str(package / "component.py"))
+
+    before = ValidationCache(tmp_path).key(b"x", DriverConfig)
+    shared.write_text("# shared types, edited\n")
+    assert ValidationCache(tmp_path).key(b"x", DriverConfig) != before
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from mushbuild.validation.report import ValidationReport
+from mushbuild.validation.ssot import SSOTValidator
+
+
+def test_report_error_marks_failed_and_groups_by_source():
+    report = ValidationReport("Cross-Validation")
+    report.note("checking...")
+    assert report.ok
+
+    report.error("uniqueness", "dup A")
+    report.error("uniqueness", "dup B")
+    report.warn("c1", "no model")
+    assert not report.ok
+
+    rendered = report.render()
+    assert rendered.count("--- uniqueness ---") == 1
+    assert "- dup A" in rendered and "- dup B" in rendered
+    assert rendered.index("⚠️ Warnings") < rendered.index("❌ Errors")
+    assert rendered.endswith("❌ Cross-Validation failed!")
+
+
+def test_ssot_validator_reports_missing_file(tmp_path: Path):
+    report, system_config = SSOTValidator(tmp_path / "missing.yaml").validate()
+    assert system_config is None
+    assert not report.ok
+    assert report.errors[0][0] == "missing.yaml"
+
+
+def test_ssot_validator_accepts_project_ssot():
+    ssot_file = Path(__file__).parent.parent / "config_sources" / "system_definition.yaml"
+    report, system_config = SSOTValidator(ssot_file).validate()
+    assert report.ok, report.render()
+    assert system_config is not None and system_config.points